@@ -0,0 +1,79 @@
+"""Build a single-file zipapp (stockbook.pyz) for deployment.
+
+The package is staged into a temporary directory, byte-compiled next to each
+source file (the layout zipimport loads from), and written to one compressed
+archive. Importing from a single archive avoids the per-module directory
+scans and .pyc freshness checks of a regular install.
+
+Usage:
+    python scripts/build_zipapp.py [--output stockbook.pyz] [--optimize 2]
+
+The third-party dependencies (PySide6, reportlab, python-dateutil) are not
+bundled and must be installed in the interpreter that runs the archive:
+    python stockbook.pyz
+"""
+
+import argparse
+import compileall
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DIR = ROOT / "src" / "stockbook"
+
+
+def build(output: Path, optimize: int) -> Path:
+    """Stage, byte-compile and archive the stockbook package."""
+    with tempfile.TemporaryDirectory() as tmp:
+        staging = Path(tmp)
+        shutil.copytree(
+            PACKAGE_DIR,
+            staging / "stockbook",
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+        )
+
+        # zipapp's generated __main__ ignores the return value, so write our
+        # own to pass main()'s exit code through.
+        (staging / "__main__.py").write_text(
+            "import sys\n\nfrom stockbook.main import main\n\nsys.exit(main())\n"
+        )
+
+        # legacy=True writes foo.pyc beside foo.py, which is what zipimport reads
+        if not compileall.compile_dir(
+            staging, quiet=1, legacy=True, optimize=optimize
+        ):
+            raise RuntimeError("Byte-compilation failed")
+
+        zipapp.create_archive(
+            staging,
+            target=output,
+            interpreter="/usr/bin/env python3",
+            compressed=True,
+        )
+    return output
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output", type=Path, default=ROOT / "stockbook.pyz", help="Archive to write"
+    )
+    parser.add_argument(
+        "--optimize",
+        type=int,
+        choices=(0, 1, 2),
+        default=2,
+        help="Bytecode optimization level (2 strips docstrings and asserts)",
+    )
+    args = parser.parse_args()
+
+    output = build(args.output, args.optimize)
+    print(f"Built {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,35 @@
 """Data models and database access."""
 
-from stockbook.models.database import Database
-from stockbook.models.entities import (
-    Animal,
-    Mob,
-    Paddock,
-    Event,
-    MovementEvent,
-    TreatmentEvent,
-    WeighEvent,
-    Product,
-    Task,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from stockbook.models.database import Database
+    from stockbook.models.entities import (
+        Animal,
+        Mob,
+        Paddock,
+        Event,
+        MovementEvent,
+        TreatmentEvent,
+        WeighEvent,
+        Product,
+        Task,
+    )
+
+# Names are resolved on first access (PEP 562) so importing the package does
+# not pull in sqlite3 or the entity module until something actually needs them.
+_LAZY = {
+    "Database": "stockbook.models.database",
+    "Animal": "stockbook.models.entities",
+    "Mob": "stockbook.models.entities",
+    "Paddock": "stockbook.models.entities",
+    "Event": "stockbook.models.entities",
+    "MovementEvent": "stockbook.models.entities",
+    "TreatmentEvent": "stockbook.models.entities",
+    "WeighEvent": "stockbook.models.entities",
+    "Product": "stockbook.models.entities",
+    "Task": "stockbook.models.entities",
+}
 
 __all__ = [
     "Database",
@@ -25,3 +43,20 @@ __all__ = [
     "Product",
     "Task",
 ]
+
+
+def __getattr__(name: str):
+    """Import re-exported names on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,12 @@
 """SQLite database management for Outback Stockbook."""
 
+import json
 import sqlite3
-import shutil
-from datetime import date, datetime
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Union
 
 from stockbook.models.entities import (
     Animal,
@@ -25,7 +27,7 @@ from stockbook.models.entities import (
 )
 
 
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 7
 
 SCHEMA_SQL = """
 -- Property settings
@@ -174,6 +176,371 @@ CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks(completed);
 CREATE INDEX IF NOT EXISTS idx_treatment_whp ON treatment_events(meat_whp_end);
 """
 
+# Schema changes applied on top of SCHEMA_SQL, keyed by the version each one
+# brings the database up to. Fresh databases start at version 1 and run them all.
+MIGRATIONS = {
+    2: """
+-- Lets get_recent_events walk the index in order and stop at its LIMIT
+CREATE INDEX IF NOT EXISTS idx_events_date_created
+    ON events(event_date DESC, created_at DESC);
+""",
+    3: """
+-- Each event joined to its detail row, so callers that need both make one query.
+-- Detail ids are aliased (t_id, m_id, w_id) to keep the column names unique.
+CREATE VIEW IF NOT EXISTS events_full AS
+SELECT
+    e.id, e.event_type, e.event_date, e.animal_id, e.mob_id, e.notes,
+    e.recorded_by, e.created_at,
+    t.id AS t_id, t.product_id, t.batch_number, t.dose, t.route,
+    t.administered_by, t.meat_whp_end, t.milk_whp_end, t.esi_end,
+    m.id AS m_id, m.from_paddock_id, m.to_paddock_id, m.reason, m.head_count,
+    w.id AS w_id, w.weight_kg, w.condition_score
+FROM events e
+LEFT JOIN treatment_events t ON t.event_id = e.id
+LEFT JOIN movement_events m ON m.event_id = e.id
+LEFT JOIN weigh_events w ON w.event_id = e.id;
+""",
+    4: """
+-- Alive animals only, so per-mob head counts skip sold and dead stock
+CREATE INDEX IF NOT EXISTS idx_animals_mob_alive ON animals(mob_id) WHERE status = 'alive';
+""",
+    5: """
+-- With idx_treatment_whp, one index per withholding end date for the WHP query
+CREATE INDEX IF NOT EXISTS idx_treatment_milk_whp
+    ON treatment_events(milk_whp_end) WHERE milk_whp_end IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_treatment_esi
+    ON treatment_events(esi_end) WHERE esi_end IS NOT NULL;
+""",
+    6: """
+-- Latest of the three withholding end dates, so the WHP query is one range
+-- scan. The expression must match _SQL_SELECT_ANIMALS_ON_WHP exactly.
+CREATE INDEX IF NOT EXISTS idx_treatment_whp_latest ON treatment_events(
+    max(coalesce(meat_whp_end, ''), coalesce(milk_whp_end, ''), coalesce(esi_end, ''))
+);
+DROP INDEX IF EXISTS idx_treatment_milk_whp;
+DROP INDEX IF EXISTS idx_treatment_esi;
+""",
+    7: """
+-- Events of one type within a date range, returned newest first. Its leading
+-- column makes idx_events_type redundant.
+CREATE INDEX IF NOT EXISTS idx_events_type_date
+    ON events(event_type, event_date, created_at);
+DROP INDEX IF EXISTS idx_events_type;
+""",
+}
+
+# Full-text index over animal tags. The trigram tokenizer matches any substring
+# of three or more characters, so it can stand in for LIKE '%...%'. Kept out of
+# MIGRATIONS because it needs SQLite built with FTS5 (3.34+ for trigram); when
+# that is missing, search falls back to a LIKE scan.
+ANIMALS_FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS animals_fts USING fts5(
+    eid, visual_tag, content='animals', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS animals_fts_insert AFTER INSERT ON animals BEGIN
+    INSERT INTO animals_fts(rowid, eid, visual_tag)
+    VALUES (new.id, new.eid, new.visual_tag);
+END;
+
+CREATE TRIGGER IF NOT EXISTS animals_fts_delete AFTER DELETE ON animals BEGIN
+    INSERT INTO animals_fts(animals_fts, rowid, eid, visual_tag)
+    VALUES ('delete', old.id, old.eid, old.visual_tag);
+END;
+
+CREATE TRIGGER IF NOT EXISTS animals_fts_update AFTER UPDATE OF eid, visual_tag ON animals
+BEGIN
+    INSERT INTO animals_fts(animals_fts, rowid, eid, visual_tag)
+    VALUES ('delete', old.id, old.eid, old.visual_tag);
+    INSERT INTO animals_fts(rowid, eid, visual_tag)
+    VALUES (new.id, new.eid, new.visual_tag);
+END;
+
+INSERT INTO animals_fts(animals_fts) VALUES ('rebuild');
+"""
+
+
+# Dates are stored as ISO-8601 text. The adapters are registered explicitly,
+# matching the stdlib defaults, which are deprecated from Python 3.12.
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+
+
+def _to_date(value: Optional[str]) -> Optional[date]:
+    """Parse a stored DATE value."""
+    return date.fromisoformat(value) if value else None
+
+
+def _to_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a stored TIMESTAMP value."""
+    return datetime.fromisoformat(value) if value else None
+
+
+# Value -> member maps for the enums stored as TEXT. A dict lookup is much
+# cheaper than calling the Enum per row; the converters still fall back to the
+# call so an unknown value raises ValueError as before.
+_SPECIES_MAP = Species._value2member_map_
+_SEX_MAP = AnimalSex._value2member_map_
+_STATUS_MAP = AnimalStatus._value2member_map_
+_ROUTE_MAP = TreatmentRoute._value2member_map_
+_EVENT_TYPE_MAP = EventType._value2member_map_
+
+# Column lists in entity field order, so rows can be unpacked by position
+# instead of looked up by name.
+_PADDOCK_COLUMNS = "id, name, area_hectares, notes, pic, created_at, updated_at"
+_MOB_COLUMNS = (
+    "id, name, species, description, current_paddock_id, created_at, updated_at"
+)
+_ANIMAL_COLUMNS = (
+    "id, eid, visual_tag, species, breed, sex, date_of_birth, status, mob_id, "
+    "dam_id, sire_id, notes, created_at, updated_at"
+)
+_ANIMAL_COLUMNS_QUALIFIED = ", ".join("a." + c for c in _ANIMAL_COLUMNS.split(", "))
+_PRODUCT_COLUMNS = (
+    "id, name, active_ingredient, category, meat_whp_days, milk_whp_days, esi_days, "
+    "default_dose, default_route, notes, created_at, updated_at"
+)
+_EVENT_COLUMNS = (
+    "id, event_type, event_date, animal_id, mob_id, notes, recorded_by, created_at"
+)
+_MOVEMENT_COLUMNS = "id, event_id, from_paddock_id, to_paddock_id, reason, head_count"
+_TREATMENT_COLUMNS = (
+    "id, event_id, product_id, batch_number, dose, route, administered_by, "
+    "meat_whp_end, milk_whp_end, esi_end"
+)
+_WEIGH_COLUMNS = "id, event_id, weight_kg, condition_score"
+_TASK_COLUMNS = (
+    "id, title, description, due_date, source_event_id, animal_id, mob_id, "
+    "completed, completed_at, created_at"
+)
+_SETTINGS_COLUMNS = (
+    "id, property_name, pic, owner_name, address, phone, email, created_at, updated_at"
+)
+
+
+# SQL statements, defined once so every call passes the same string object
+# and hits the connection's prepared-statement cache.
+#
+# The *_BY_IDS statements take a list of ids: their {} is filled with one
+# placeholder per id by _select_by_ids, which keeps each statement under
+# SQLite's bound-parameter limit.
+_MAX_IDS_PER_QUERY = 500
+
+# Paddocks
+_SQL_INSERT_PADDOCK = """INSERT INTO paddocks (name, area_hectares, notes, pic,
+    created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_PADDOCK = """UPDATE paddocks SET name=?, area_hectares=?, notes=?, pic=?, updated_at=?
+    WHERE id=?"""
+_SQL_SELECT_PADDOCK = f"SELECT {_PADDOCK_COLUMNS} FROM paddocks WHERE id = ?"
+_SQL_SELECT_ALL_PADDOCKS = f"SELECT {_PADDOCK_COLUMNS} FROM paddocks ORDER BY name"
+_SQL_DELETE_PADDOCK = "DELETE FROM paddocks WHERE id = ?"
+
+# Mobs
+_SQL_INSERT_MOB = """INSERT INTO mobs (name, species, description, current_paddock_id,
+    created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_MOB = """UPDATE mobs SET name=?, species=?, description=?, current_paddock_id=?,
+    updated_at=? WHERE id=?"""
+_SQL_SELECT_MOB = f"SELECT {_MOB_COLUMNS} FROM mobs WHERE id = ?"
+_SQL_SELECT_MOBS_BY_IDS = f"SELECT {_MOB_COLUMNS} FROM mobs WHERE id IN ({{}})"
+_SQL_SELECT_ALL_MOBS = f"SELECT {_MOB_COLUMNS} FROM mobs ORDER BY name"
+_SQL_DELETE_MOB = "DELETE FROM mobs WHERE id = ?"
+# The literal status = 'alive' must match idx_animals_mob_alive's WHERE clause
+_SQL_COUNT_MOB_ANIMALS = "SELECT COUNT(*) FROM animals WHERE mob_id = ? AND status = 'alive'"
+
+# Animals
+_SQL_INSERT_ANIMAL = """INSERT INTO animals (eid, visual_tag, species, breed, sex, date_of_birth,
+    status, mob_id, dam_id, sire_id, notes, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_ANIMAL = """UPDATE animals SET eid=?, visual_tag=?, species=?, breed=?, sex=?,
+    date_of_birth=?, status=?, mob_id=?, dam_id=?, sire_id=?, notes=?,
+    updated_at=? WHERE id=?"""
+# The ids are bound as one JSON array, whatever their number
+_SQL_SET_ANIMALS_MOB = """UPDATE animals SET mob_id=?, updated_at=?
+    WHERE id IN (SELECT value FROM json_each(?))"""
+_SQL_SET_ANIMALS_STATUS = """UPDATE animals SET status=?, updated_at=?
+    WHERE id IN (SELECT value FROM json_each(?))"""
+_SQL_SELECT_ANIMAL = f"SELECT {_ANIMAL_COLUMNS} FROM animals WHERE id = ?"
+_SQL_SELECT_ANIMALS_BY_IDS = f"SELECT {_ANIMAL_COLUMNS} FROM animals WHERE id IN ({{}})"
+_SQL_SELECT_ANIMAL_BY_EID = f"SELECT {_ANIMAL_COLUMNS} FROM animals WHERE eid = ?"
+_SQL_SELECT_ANIMALS_BY_STATUS = f"""SELECT {_ANIMAL_COLUMNS} FROM animals WHERE status = ?
+    ORDER BY visual_tag, eid"""
+_SQL_SELECT_ALL_ANIMALS = f"SELECT {_ANIMAL_COLUMNS} FROM animals ORDER BY visual_tag, eid"
+_SQL_SELECT_ANIMALS_BY_MOB = f"""SELECT {_ANIMAL_COLUMNS} FROM animals WHERE mob_id = ?
+    ORDER BY visual_tag, eid"""
+_SQL_SEARCH_ANIMALS = f"""SELECT {_ANIMAL_COLUMNS} FROM animals
+    WHERE eid LIKE ? OR visual_tag LIKE ?
+    ORDER BY visual_tag, eid"""
+# filter_animals/count_filtered_animals fill in the WHERE clause from
+# _animal_filter(); there are only sixteen possible clauses
+_SQL_FILTER_ANIMALS = f"""SELECT {_ANIMAL_COLUMNS} FROM animals {{}}
+    ORDER BY visual_tag, eid LIMIT ?"""
+_SQL_COUNT_FILTERED_ANIMALS = "SELECT COUNT(*) FROM animals {}"
+_SQL_SEARCH_ANIMALS_FTS = f"""SELECT {_ANIMAL_COLUMNS_QUALIFIED}
+    FROM animals_fts f JOIN animals a ON a.id = f.rowid
+    WHERE animals_fts MATCH ?
+    ORDER BY a.visual_tag, a.eid"""
+_SQL_DELETE_ANIMAL = "DELETE FROM animals WHERE id = ?"
+
+# Products
+_SQL_INSERT_PRODUCT = """INSERT INTO products (name, active_ingredient, category, meat_whp_days,
+    milk_whp_days, esi_days, default_dose, default_route, notes,
+    created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_PRODUCT = """UPDATE products SET name=?, active_ingredient=?, category=?,
+    meat_whp_days=?, milk_whp_days=?, esi_days=?, default_dose=?, default_route=?, notes=?,
+    updated_at=? WHERE id=?"""
+_SQL_SELECT_PRODUCT = f"SELECT {_PRODUCT_COLUMNS} FROM products WHERE id = ?"
+_SQL_SELECT_ALL_PRODUCTS = f"SELECT {_PRODUCT_COLUMNS} FROM products ORDER BY name"
+_SQL_DELETE_PRODUCT = "DELETE FROM products WHERE id = ?"
+
+# Events
+_SQL_INSERT_EVENT = """INSERT INTO events (event_type, event_date, animal_id, mob_id, notes,
+    recorded_by, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_EVENT = """UPDATE events SET event_type=?, event_date=?, animal_id=?, mob_id=?,
+    notes=?, recorded_by=? WHERE id=?"""
+_SQL_INSERT_MOVEMENT = """INSERT INTO movement_events (event_id, from_paddock_id, to_paddock_id,
+    reason, head_count) VALUES (?, ?, ?, ?, ?)"""
+_SQL_UPDATE_MOVEMENT = """UPDATE movement_events SET from_paddock_id=?, to_paddock_id=?, reason=?,
+    head_count=? WHERE id=?"""
+_SQL_INSERT_TREATMENT = """INSERT INTO treatment_events (event_id, product_id, batch_number, dose,
+    route, administered_by, meat_whp_end, milk_whp_end, esi_end)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_TREATMENT = """UPDATE treatment_events SET product_id=?, batch_number=?, dose=?,
+    route=?, administered_by=?, meat_whp_end=?, milk_whp_end=?, esi_end=? WHERE id=?"""
+_SQL_INSERT_WEIGH = """INSERT INTO weigh_events (event_id, weight_kg, condition_score)
+    VALUES (?, ?, ?)"""
+_SQL_UPDATE_WEIGH = "UPDATE weigh_events SET weight_kg=?, condition_score=? WHERE id=?"
+_SQL_SELECT_ANIMAL_EVENTS_BY_TYPE = f"""SELECT {_EVENT_COLUMNS} FROM events
+    WHERE animal_id = ? AND event_type = ?
+    ORDER BY event_date DESC"""
+_SQL_SELECT_ANIMAL_EVENTS = f"""SELECT {_EVENT_COLUMNS} FROM events WHERE animal_id = ?
+    ORDER BY event_date DESC"""
+_SQL_SELECT_MOB_EVENTS_BY_TYPE = f"""SELECT {_EVENT_COLUMNS} FROM events
+    WHERE mob_id = ? AND event_type = ?
+    ORDER BY event_date DESC"""
+_SQL_SELECT_MOB_EVENTS = f"""SELECT {_EVENT_COLUMNS} FROM events WHERE mob_id = ?
+    ORDER BY event_date DESC"""
+_SQL_SELECT_RECENT_EVENTS = f"""SELECT {_EVENT_COLUMNS} FROM events
+    ORDER BY event_date DESC, created_at DESC LIMIT ?"""
+_SQL_SELECT_EVENTS_BY_TYPE_IN_RANGE = f"""SELECT {_EVENT_COLUMNS} FROM events
+    WHERE event_type = ? AND event_date BETWEEN ? AND ?
+    ORDER BY event_date DESC, created_at DESC"""
+_SQL_SELECT_ANIMAL_EVENTS_FULL = """SELECT * FROM events_full WHERE animal_id = ?
+    ORDER BY event_date DESC"""
+_SQL_SELECT_TREATMENT = f"SELECT {_TREATMENT_COLUMNS} FROM treatment_events WHERE event_id = ?"
+_SQL_SELECT_MOVEMENT = f"SELECT {_MOVEMENT_COLUMNS} FROM movement_events WHERE event_id = ?"
+_SQL_SELECT_WEIGH = f"SELECT {_WEIGH_COLUMNS} FROM weigh_events WHERE event_id = ?"
+_SQL_SELECT_TREATMENTS_BY_EVENT_IDS = f"""SELECT {_TREATMENT_COLUMNS} FROM treatment_events
+    WHERE event_id IN ({{}})"""
+_SQL_SELECT_MOVEMENTS_BY_EVENT_IDS = f"""SELECT {_MOVEMENT_COLUMNS} FROM movement_events
+    WHERE event_id IN ({{}})"""
+_SQL_SELECT_WEIGHS_BY_EVENT_IDS = f"""SELECT {_WEIGH_COLUMNS} FROM weigh_events
+    WHERE event_id IN ({{}})"""
+
+# Withholding periods. A treatment is active while the latest of its end dates
+# has not passed; that expression is indexed (idx_treatment_whp_latest). The
+# unary + in ORDER BY stops the planner scanning idx_treatment_whp for the sort
+# order instead of using the range search. Both parameters are the as-of date.
+_SQL_SELECT_ANIMALS_ON_WHP = """
+    SELECT
+        a.id as animal_id, a.eid, a.visual_tag,
+        e.id as event_id, e.event_date,
+        t.meat_whp_end, t.milk_whp_end, t.esi_end,
+        p.name as product_name,
+        CAST(julianday(t.meat_whp_end) - julianday(?) AS INTEGER) as days_left
+    FROM treatment_events t
+    JOIN events e ON t.event_id = e.id
+    JOIN animals a ON e.animal_id = a.id
+    LEFT JOIN products p ON t.product_id = p.id
+    WHERE max(coalesce(t.meat_whp_end, ''), coalesce(t.milk_whp_end, ''),
+              coalesce(t.esi_end, '')) >= ?
+      AND a.status = 'alive'
+    ORDER BY +t.meat_whp_end, a.visual_tag
+"""
+
+# Alive animals with no active treatment, i.e. clear to sell. The subquery
+# runs once, as a range search on idx_treatment_whp_latest; the IS NOT NULL
+# keeps mob-level events from putting a NULL into the NOT IN list.
+_SQL_SELECT_SALE_READY_ANIMALS = f"""
+    SELECT {_ANIMAL_COLUMNS} FROM animals
+    WHERE status = 'alive' AND id NOT IN (
+        SELECT e.animal_id
+        FROM treatment_events t
+        JOIN events e ON t.event_id = e.id
+        WHERE max(coalesce(t.meat_whp_end, ''), coalesce(t.milk_whp_end, ''),
+                  coalesce(t.esi_end, '')) >= ?
+          AND e.animal_id IS NOT NULL
+    )
+    ORDER BY visual_tag, eid
+"""
+
+# Report rows. Each joins a date range of events to everything its report
+# shows, formatted for display. The identifier follows Animal.display_id,
+# falling back to the mob.
+_SQL_SELECT_TREATMENT_REGISTER = """
+    SELECT
+        strftime('%d/%m/%Y', e.event_date),
+        CASE
+            WHEN e.animal_id IS NOT NULL THEN
+                coalesce(nullif(a.visual_tag, ''), nullif(a.eid, ''), '#' || a.id, '')
+            ELSE coalesce('Mob: ' || m.name, '')
+        END,
+        coalesce(p.name, 'Unknown'),
+        coalesce(t.dose, ''), coalesce(t.batch_number, ''),
+        coalesce(strftime('%d/%m/%Y', t.meat_whp_end), ''),
+        coalesce(t.administered_by, '')
+    FROM events e
+    JOIN treatment_events t ON t.event_id = e.id
+    LEFT JOIN animals a ON a.id = e.animal_id
+    LEFT JOIN mobs m ON m.id = e.mob_id
+    LEFT JOIN products p ON p.id = t.product_id
+    WHERE e.event_type = 'treatment' AND e.event_date BETWEEN ? AND ?
+    ORDER BY e.event_date DESC, e.created_at DESC
+"""
+_SQL_SELECT_MOVEMENT_LOG = """
+    SELECT
+        strftime('%d/%m/%Y', e.event_date),
+        CASE
+            WHEN e.animal_id IS NOT NULL THEN
+                coalesce(nullif(a.visual_tag, ''), nullif(a.eid, ''), '#' || a.id, '')
+            ELSE coalesce(m.name, '')
+        END,
+        coalesce(fp.name, '-'), coalesce(tp.name, '-'),
+        coalesce(nullif(mv.reason, ''), '-'),
+        CASE WHEN mv.head_count THEN CAST(mv.head_count AS TEXT) ELSE '-' END
+    FROM events e
+    JOIN movement_events mv ON mv.event_id = e.id
+    LEFT JOIN animals a ON a.id = e.animal_id
+    LEFT JOIN mobs m ON m.id = e.mob_id
+    LEFT JOIN paddocks fp ON fp.id = mv.from_paddock_id
+    LEFT JOIN paddocks tp ON tp.id = mv.to_paddock_id
+    WHERE e.event_type = 'movement' AND e.event_date BETWEEN ? AND ?
+    ORDER BY e.event_date DESC, e.created_at DESC
+"""
+
+# Tasks
+_SQL_INSERT_TASK = """INSERT INTO tasks (title, description, due_date, source_event_id,
+    animal_id, mob_id, completed, completed_at, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_TASK = """UPDATE tasks SET title=?, description=?, due_date=?, source_event_id=?,
+    animal_id=?, mob_id=?, completed=?, completed_at=? WHERE id=?"""
+_SQL_SELECT_PENDING_TASKS = f"""SELECT {_TASK_COLUMNS} FROM tasks
+    WHERE completed = 0 AND (due_date IS NULL OR due_date <= ?)
+    ORDER BY due_date NULLS LAST, created_at"""
+_SQL_COMPLETE_TASK = "UPDATE tasks SET completed = 1, completed_at = ? WHERE id = ?"
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+
+# Property settings
+_SQL_SELECT_SETTINGS = f"SELECT {_SETTINGS_COLUMNS} FROM property_settings LIMIT 1"
+_SQL_INSERT_SETTINGS = """INSERT INTO property_settings (property_name, pic, owner_name, address,
+    phone, email, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_SETTINGS = """UPDATE property_settings SET property_name=?, pic=?, owner_name=?,
+    address=?, phone=?, email=?, updated_at=? WHERE id=?"""
+
+# Statistics
+_SQL_COUNT_ANIMALS_BY_STATUS = "SELECT status, COUNT(*) as count FROM animals GROUP BY status"
+_SQL_COUNT_ALIVE_BY_SPECIES = """SELECT species, COUNT(*) as count FROM animals
+    WHERE status = 'alive' GROUP BY species"""
+
 
 class Database:
     """SQLite database manager for Outback Stockbook."""
@@ -192,19 +559,78 @@ class Database:
 
         self.db_path = Path(db_path)
         self._conn: Optional[sqlite3.Connection] = None
+        self._connect_thread: Optional[threading.Thread] = None
+        self._in_tx = False
+        self._has_fts = False
+        self._commit_count = 0
+        self._mob_cache: Optional[tuple[Mob, ...]] = None
+        self._product_cache: Optional[tuple[Product, ...]] = None
 
     def connect(self) -> None:
         """Open database connection and ensure schema exists."""
+        # check_same_thread is off so a connection opened by connect_async()
+        # can be handed to the UI thread; access is never concurrent because
+        # conn waits for the worker to finish first.
+        #
+        # isolation_level=None leaves transactions to transaction(), so the driver
+        # does not inspect each statement to decide whether to open one itself.
+        #
+        # detect_types is deliberately left off: its converters run in Python
+        # for every DATE/TIMESTAMP column read. Converters parse with the
+        # C-level fromisoformat instead (see _to_date/_to_datetime).
         self._conn = sqlite3.connect(
             self.db_path,
-            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            check_same_thread=False,
+            cached_statements=256,
+            isolation_level=None,
         )
         self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._configure_connection()
         self._init_schema()
 
+    def _configure_connection(self) -> None:
+        """Apply per-connection PRAGMAs.
+
+        WAL lets reads proceed while a write is in progress, and with WAL
+        synchronous=NORMAL is still crash-safe while avoiding an fsync on
+        every commit. The larger page cache and memory-mapped I/O keep the
+        animals/events indexes resident, and cache_spill is off so a large
+        transaction stays in that cache until it commits.
+        """
+        conn = self._conn
+        conn.execute("PRAGMA foreign_keys = ON")
+        if str(self.db_path) != ":memory:":
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA wal_autocheckpoint = 1000")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+        conn.execute("PRAGMA cache_spill = 0")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
+
+    def connect_async(self) -> None:
+        """Open the connection on a worker thread.
+
+        The first use of ``conn`` waits for the worker, so the caller can carry
+        on with other startup work while the file is opened and the schema
+        checked. If the worker fails, ``conn`` retries on the calling thread
+        so the error surfaces there.
+        """
+        self._connect_thread = threading.Thread(
+            target=self.connect, name="stockbook-db-connect", daemon=True
+        )
+        self._connect_thread.start()
+
+    def _wait_for_connect(self) -> None:
+        """Block until a pending connect_async() call has finished."""
+        thread = self._connect_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+            self._connect_thread = None
+
     def close(self) -> None:
         """Close database connection."""
+        self._wait_for_connect()
         if self._conn:
             self._conn.close()
             self._conn = None
@@ -212,10 +638,117 @@ class Database:
     @property
     def conn(self) -> sqlite3.Connection:
         """Get the database connection, connecting if necessary."""
+        self._wait_for_connect()
         if self._conn is None:
             self.connect()
         return self._conn
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into a single transaction and commit.
+
+        Every write method runs its statements in one of these blocks. Nested
+        blocks, including save_*/delete_* calls made inside a caller's block,
+        join the outermost transaction, so it commits once at the end. Any
+        exception rolls the whole transaction back.
+        """
+        if self._in_tx:
+            yield
+            return
+
+        conn = self.conn
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        self._in_tx = True
+        try:
+            yield
+        except BaseException:
+            conn.rollback()
+            # Anything cached while the transaction was open may be gone now
+            self._mob_cache = None
+            self._product_cache = None
+            raise
+        else:
+            conn.commit()
+            self._commit_count += 1
+        finally:
+            self._in_tx = False
+
+    @property
+    def data_version(self) -> tuple[int, int]:
+        """A value that changes whenever the database is written to.
+
+        Counts commits made through this object, paired with SQLite's
+        PRAGMA data_version, which changes when another connection commits
+        (such as a quick action's write on a pool thread). Compare it with an
+        earlier reading to tell whether data loaded since then may be stale.
+        """
+        return (self._commit_count, self.conn.execute("PRAGMA data_version").fetchone()[0])
+
+    @contextmanager
+    def read_transaction(self) -> Iterator[None]:
+        """Run several reads against one consistent snapshot of the database.
+
+        Opens a deferred transaction, which takes no write lock; in WAL mode
+        every query inside the block sees the database as of its first read.
+        Like transaction(), a block opened inside another one joins it.
+        """
+        if self._in_tx:
+            yield
+            return
+
+        conn = self.conn
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN")
+        self._in_tx = True
+        try:
+            yield
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            self._in_tx = False
+
+    def _tuple_cursor(self) -> sqlite3.Cursor:
+        """Return a cursor that yields plain tuples rather than sqlite3.Row.
+
+        Used for reads fed to the positional _row_to_* converters, where
+        building a Row per result is wasted work. List-returning callers
+        iterate the cursor itself, so each row is converted as it is stepped
+        instead of the whole result set being materialised first.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor
+
+    def _select_by_ids(self, sql: str, ids: Iterable[int]) -> Iterator[tuple]:
+        """Yield the rows of a *_BY_IDS statement for the given ids.
+
+        The ids are bound in chunks of _MAX_IDS_PER_QUERY, one statement per
+        chunk, so the number of queries grows with len(ids) / 500 rather than
+        with len(ids).
+        """
+        ids = list(ids)
+        cursor = self._tuple_cursor()
+        for start in range(0, len(ids), _MAX_IDS_PER_QUERY):
+            chunk = ids[start : start + _MAX_IDS_PER_QUERY]
+            cursor.execute(sql.format(", ".join("?" * len(chunk))), chunk)
+            yield from cursor
+
+    def _update_by_ids(self, sql: str, values: tuple, ids: Iterable[int]) -> None:
+        """Run an UPDATE ... WHERE id IN (... json_each(?)) statement for the given ids.
+
+        values are bound first and the ids last, as a single JSON array, so
+        one statement covers any number of ids without hitting SQLite's
+        limit on bound variables.
+        """
+        with self.transaction():
+            self.conn.execute(sql, values + (json.dumps(list(ids)),))
+
     def _init_schema(self) -> None:
         """Initialize database schema if needed."""
         cursor = self.conn.cursor()
@@ -227,65 +760,91 @@ class Database:
         if cursor.fetchone() is None:
             # Fresh database, create schema
             cursor.executescript(SCHEMA_SQL)
-            cursor.execute("INSERT INTO schema_version (version) VALUES (?)", (SCHEMA_VERSION,))
+            cursor.execute("INSERT INTO schema_version (version) VALUES (1)")
             self.conn.commit()
 
+        # Bring older databases up to date
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+        version = cursor.fetchone()[0] or 1
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            cursor.executescript(MIGRATIONS[target])
+            cursor.execute("INSERT INTO schema_version (version) VALUES (?)", (target,))
+            self.conn.commit()
+
+        self._init_search_index()
+
+    def _init_search_index(self) -> None:
+        """Create the animals_fts index if this SQLite build supports it."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='animals_fts'")
+        if cursor.fetchone() is None:
+            try:
+                cursor.executescript(ANIMALS_FTS_SQL)
+            except sqlite3.OperationalError:
+                # No FTS5 or no trigram tokenizer; search_animals uses LIKE instead
+                self.conn.rollback()
+                self._has_fts = False
+                return
+        self._has_fts = True
+
     # -------------------------------------------------------------------------
     # Paddock operations
     # -------------------------------------------------------------------------
 
     def save_paddock(self, paddock: Paddock) -> Paddock:
         """Save a paddock (insert or update)."""
-        cursor = self.conn.cursor()
         now = datetime.now()
-
-        if paddock.id is None:
-            cursor.execute(
-                """INSERT INTO paddocks (name, area_hectares, notes, pic, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (paddock.name, paddock.area_hectares, paddock.notes, paddock.pic, now, now),
-            )
-            paddock.id = cursor.lastrowid
-            paddock.created_at = now
-        else:
-            cursor.execute(
-                """UPDATE paddocks SET name=?, area_hectares=?, notes=?, pic=?, updated_at=?
-                   WHERE id=?""",
-                (paddock.name, paddock.area_hectares, paddock.notes, paddock.pic, now, paddock.id),
-            )
-        paddock.updated_at = now
-        self.conn.commit()
+        with self.transaction():
+            if paddock.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_PADDOCK,
+                    (paddock.name, paddock.area_hectares, paddock.notes, paddock.pic, now, now),
+                )
+                paddock.id = cursor.lastrowid
+                paddock.created_at = now
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_PADDOCK,
+                    (
+                        paddock.name,
+                        paddock.area_hectares,
+                        paddock.notes,
+                        paddock.pic,
+                        now,
+                        paddock.id,
+                    ),
+                )
+            paddock.updated_at = now
         return paddock
 
     def get_paddock(self, paddock_id: int) -> Optional[Paddock]:
         """Get a paddock by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM paddocks WHERE id = ?", (paddock_id,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_PADDOCK, (paddock_id,))
         row = cursor.fetchone()
         return self._row_to_paddock(row) if row else None
 
     def get_all_paddocks(self) -> list[Paddock]:
         """Get all paddocks."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM paddocks ORDER BY name")
-        return [self._row_to_paddock(row) for row in cursor.fetchall()]
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_ALL_PADDOCKS)
+        return [self._row_to_paddock(row) for row in cursor]
 
     def delete_paddock(self, paddock_id: int) -> None:
         """Delete a paddock."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM paddocks WHERE id = ?", (paddock_id,))
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute(_SQL_DELETE_PADDOCK, (paddock_id,))
 
-    def _row_to_paddock(self, row: sqlite3.Row) -> Paddock:
+    def _row_to_paddock(self, row: tuple) -> Paddock:
         """Convert a database row to a Paddock object."""
         return Paddock(
-            id=row["id"],
-            name=row["name"],
-            area_hectares=row["area_hectares"],
-            notes=row["notes"],
-            pic=row["pic"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
+            row[0],
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            _to_datetime(row[5]),
+            _to_datetime(row[6]),
         )
 
     # -------------------------------------------------------------------------
@@ -294,78 +853,95 @@ class Database:
 
     def save_mob(self, mob: Mob) -> Mob:
         """Save a mob (insert or update)."""
-        cursor = self.conn.cursor()
         now = datetime.now()
-
-        if mob.id is None:
-            cursor.execute(
-                """INSERT INTO mobs (name, species, description, current_paddock_id,
-                   created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)""",
-                (
-                    mob.name,
-                    mob.species.value,
-                    mob.description,
-                    mob.current_paddock_id,
-                    now,
-                    now,
-                ),
-            )
-            mob.id = cursor.lastrowid
-            mob.created_at = now
-        else:
-            cursor.execute(
-                """UPDATE mobs SET name=?, species=?, description=?, current_paddock_id=?,
-                   updated_at=? WHERE id=?""",
-                (
-                    mob.name,
-                    mob.species.value,
-                    mob.description,
-                    mob.current_paddock_id,
-                    now,
-                    mob.id,
-                ),
-            )
-        mob.updated_at = now
-        self.conn.commit()
+        with self.transaction():
+            if mob.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_MOB,
+                    (
+                        mob.name,
+                        mob.species.value,
+                        mob.description,
+                        mob.current_paddock_id,
+                        now,
+                        now,
+                    ),
+                )
+                mob.id = cursor.lastrowid
+                mob.created_at = now
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_MOB,
+                    (
+                        mob.name,
+                        mob.species.value,
+                        mob.description,
+                        mob.current_paddock_id,
+                        now,
+                        mob.id,
+                    ),
+                )
+            mob.updated_at = now
+        self._mob_cache = None
         return mob
 
     def get_mob(self, mob_id: int) -> Optional[Mob]:
         """Get a mob by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM mobs WHERE id = ?", (mob_id,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_MOB, (mob_id,))
         row = cursor.fetchone()
         return self._row_to_mob(row) if row else None
 
     def get_all_mobs(self) -> list[Mob]:
         """Get all mobs."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM mobs ORDER BY name")
-        return [self._row_to_mob(row) for row in cursor.fetchall()]
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_ALL_MOBS)
+        return [self._row_to_mob(row) for row in cursor]
+
+    @property
+    def mob_cache(self) -> tuple[Mob, ...]:
+        """All mobs, as get_all_mobs() returns them, read once and kept.
+
+        For pick lists that are rebuilt often, such as the mob combo in each
+        animal dialog. Dropped by save_mob(), delete_mob(), a rolled-back
+        transaction and restore(). The Mob objects are shared, so treat them
+        as read-only; use get_all_mobs() for copies to edit.
+        """
+        mobs = self._mob_cache
+        if mobs is None:
+            mobs = tuple(self.get_all_mobs())
+            self._mob_cache = mobs
+        return mobs
+
+    def get_mobs_by_ids(self, mob_ids: Iterable[int]) -> dict[int, Mob]:
+        """Get mobs keyed by ID. IDs that do not exist are left out."""
+        return {
+            row[0]: self._row_to_mob(row)
+            for row in self._select_by_ids(_SQL_SELECT_MOBS_BY_IDS, mob_ids)
+        }
 
     def delete_mob(self, mob_id: int) -> None:
         """Delete a mob."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM mobs WHERE id = ?", (mob_id,))
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute(_SQL_DELETE_MOB, (mob_id,))
+        self._mob_cache = None
 
     def get_mob_animal_count(self, mob_id: int) -> int:
         """Get count of alive animals in a mob."""
         cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT COUNT(*) FROM animals WHERE mob_id = ? AND status = 'alive'", (mob_id,)
-        )
+        cursor.execute(_SQL_COUNT_MOB_ANIMALS, (mob_id,))
         return cursor.fetchone()[0]
 
-    def _row_to_mob(self, row: sqlite3.Row) -> Mob:
+    def _row_to_mob(self, row: tuple) -> Mob:
         """Convert a database row to a Mob object."""
         return Mob(
-            id=row["id"],
-            name=row["name"],
-            species=Species(row["species"]),
-            description=row["description"],
-            current_paddock_id=row["current_paddock_id"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
+            row[0],
+            row[1],
+            _SPECIES_MAP.get(row[2]) or Species(row[2]),
+            row[3],
+            row[4],
+            _to_datetime(row[5]),
+            _to_datetime(row[6]),
         )
 
     # -------------------------------------------------------------------------
@@ -374,126 +950,228 @@ class Database:
 
     def save_animal(self, animal: Animal) -> Animal:
         """Save an animal (insert or update)."""
-        cursor = self.conn.cursor()
         now = datetime.now()
+        with self.transaction():
+            if animal.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_ANIMAL,
+                    (
+                        animal.eid,
+                        animal.visual_tag,
+                        animal.species.value,
+                        animal.breed,
+                        animal.sex.value,
+                        animal.date_of_birth,
+                        animal.status.value,
+                        animal.mob_id,
+                        animal.dam_id,
+                        animal.sire_id,
+                        animal.notes,
+                        now,
+                        now,
+                    ),
+                )
+                animal.id = cursor.lastrowid
+                animal.created_at = now
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_ANIMAL,
+                    (
+                        animal.eid,
+                        animal.visual_tag,
+                        animal.species.value,
+                        animal.breed,
+                        animal.sex.value,
+                        animal.date_of_birth,
+                        animal.status.value,
+                        animal.mob_id,
+                        animal.dam_id,
+                        animal.sire_id,
+                        animal.notes,
+                        now,
+                        animal.id,
+                    ),
+                )
+            animal.updated_at = now
+        return animal
 
-        if animal.id is None:
-            cursor.execute(
-                """INSERT INTO animals (eid, visual_tag, species, breed, sex, date_of_birth,
-                   status, mob_id, dam_id, sire_id, notes, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    animal.eid,
-                    animal.visual_tag,
-                    animal.species.value,
-                    animal.breed,
-                    animal.sex.value,
-                    animal.date_of_birth,
-                    animal.status.value,
-                    animal.mob_id,
-                    animal.dam_id,
-                    animal.sire_id,
-                    animal.notes,
-                    now,
-                    now,
-                ),
-            )
-            animal.id = cursor.lastrowid
-            animal.created_at = now
-        else:
-            cursor.execute(
-                """UPDATE animals SET eid=?, visual_tag=?, species=?, breed=?, sex=?,
-                   date_of_birth=?, status=?, mob_id=?, dam_id=?, sire_id=?, notes=?,
-                   updated_at=? WHERE id=?""",
-                (
-                    animal.eid,
-                    animal.visual_tag,
-                    animal.species.value,
-                    animal.breed,
-                    animal.sex.value,
-                    animal.date_of_birth,
-                    animal.status.value,
-                    animal.mob_id,
-                    animal.dam_id,
-                    animal.sire_id,
-                    animal.notes,
-                    now,
-                    animal.id,
-                ),
+    def save_animals_bulk(self, animals: list[Animal]) -> None:
+        """Save many animals (insert or update) in a single transaction.
+
+        Inserts and updates each go through one executemany call. Newly
+        inserted animals are not given their ids; use save_animal() where the
+        id is needed straight away.
+        """
+        now = datetime.now()
+        inserts = []
+        updates = []
+        for animal in animals:
+            values = (
+                animal.eid,
+                animal.visual_tag,
+                animal.species.value,
+                animal.breed,
+                animal.sex.value,
+                animal.date_of_birth,
+                animal.status.value,
+                animal.mob_id,
+                animal.dam_id,
+                animal.sire_id,
+                animal.notes,
+                now,
             )
-        animal.updated_at = now
-        self.conn.commit()
-        return animal
+            if animal.id is None:
+                inserts.append(values + (now,))
+                animal.created_at = now
+            else:
+                updates.append(values + (animal.id,))
+            animal.updated_at = now
+
+        with self.transaction():
+            cursor = self.conn.cursor()
+            if inserts:
+                cursor.executemany(_SQL_INSERT_ANIMAL, inserts)
+            if updates:
+                cursor.executemany(_SQL_UPDATE_ANIMAL, updates)
+
+    def bulk_set_mob(self, animal_ids: Iterable[int], mob_id: Optional[int]) -> None:
+        """Move many animals into a mob (or out of any mob) in one transaction."""
+        self._update_by_ids(_SQL_SET_ANIMALS_MOB, (mob_id, datetime.now()), animal_ids)
+
+    def bulk_set_status(self, animal_ids: Iterable[int], status: AnimalStatus) -> None:
+        """Set the status of many animals in one transaction."""
+        self._update_by_ids(_SQL_SET_ANIMALS_STATUS, (status.value, datetime.now()), animal_ids)
 
     def get_animal(self, animal_id: int) -> Optional[Animal]:
         """Get an animal by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM animals WHERE id = ?", (animal_id,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_ANIMAL, (animal_id,))
         row = cursor.fetchone()
         return self._row_to_animal(row) if row else None
 
+    def get_animals_by_ids(self, animal_ids: Iterable[int]) -> dict[int, Animal]:
+        """Get animals keyed by ID. IDs that do not exist are left out."""
+        return {
+            row[0]: self._row_to_animal(row)
+            for row in self._select_by_ids(_SQL_SELECT_ANIMALS_BY_IDS, animal_ids)
+        }
+
     def get_animal_by_eid(self, eid: str) -> Optional[Animal]:
         """Get an animal by EID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM animals WHERE eid = ?", (eid,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_ANIMAL_BY_EID, (eid,))
         row = cursor.fetchone()
         return self._row_to_animal(row) if row else None
 
     def get_all_animals(self, status: Optional[AnimalStatus] = None) -> list[Animal]:
         """Get all animals, optionally filtered by status."""
-        cursor = self.conn.cursor()
+        cursor = self._tuple_cursor()
         if status:
-            cursor.execute(
-                "SELECT * FROM animals WHERE status = ? ORDER BY visual_tag, eid",
-                (status.value,),
-            )
+            cursor.execute(_SQL_SELECT_ANIMALS_BY_STATUS, (status.value,))
         else:
-            cursor.execute("SELECT * FROM animals ORDER BY visual_tag, eid")
-        return [self._row_to_animal(row) for row in cursor.fetchall()]
+            cursor.execute(_SQL_SELECT_ALL_ANIMALS)
+        return [self._row_to_animal(row) for row in cursor]
 
     def get_animals_by_mob(self, mob_id: int) -> list[Animal]:
         """Get all animals in a mob."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM animals WHERE mob_id = ? ORDER BY visual_tag, eid", (mob_id,)
-        )
-        return [self._row_to_animal(row) for row in cursor.fetchall()]
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_ANIMALS_BY_MOB, (mob_id,))
+        return [self._row_to_animal(row) for row in cursor]
 
     def search_animals(self, query: str) -> list[Animal]:
         """Search animals by EID or visual tag."""
-        cursor = self.conn.cursor()
-        like_query = f"%{query}%"
-        cursor.execute(
-            """SELECT * FROM animals
-               WHERE eid LIKE ? OR visual_tag LIKE ?
-               ORDER BY visual_tag, eid""",
-            (like_query, like_query),
-        )
-        return [self._row_to_animal(row) for row in cursor.fetchall()]
+        cursor = self._tuple_cursor()
+        if self._has_fts and len(query) >= 3:
+            # Quote as an FTS5 phrase so the text is matched literally
+            phrase = '"' + query.replace('"', '""') + '"'
+            cursor.execute(_SQL_SEARCH_ANIMALS_FTS, (phrase,))
+        else:
+            # Trigrams cannot match one- or two-character queries
+            like_query = f"%{query}%"
+            cursor.execute(_SQL_SEARCH_ANIMALS, (like_query, like_query))
+        return [self._row_to_animal(row) for row in cursor]
+
+    @staticmethod
+    def _animal_filter(
+        status: Optional[AnimalStatus],
+        species: Optional[Species],
+        mob_id: Optional[int],
+        text: str,
+    ) -> tuple[str, list]:
+        """Build the WHERE clause and parameters for filter_animals()."""
+        conditions = []
+        params: list = []
+        if status:
+            conditions.append("status = ?")
+            params.append(status.value)
+        if species:
+            conditions.append("species = ?")
+            params.append(species.value)
+        if mob_id:
+            conditions.append("mob_id = ?")
+            params.append(mob_id)
+        if text:
+            # LIKE ignores ASCII case; escape its wildcards so text is matched literally
+            pattern = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            conditions.append(
+                "(visual_tag LIKE ? ESCAPE '\\' OR eid LIKE ? ESCAPE '\\'"
+                " OR breed LIKE ? ESCAPE '\\')"
+            )
+            params.extend((pattern, pattern, pattern))
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return where, params
+
+    def filter_animals(
+        self,
+        status: Optional[AnimalStatus] = None,
+        species: Optional[Species] = None,
+        mob_id: Optional[int] = None,
+        text: str = "",
+        limit: int = -1,
+    ) -> list[Animal]:
+        """Get animals matching every filter given, in tag order.
+
+        text matches anywhere in the visual tag, EID or breed, ignoring case.
+        At most limit animals are returned; a negative limit returns them all.
+        """
+        where, params = self._animal_filter(status, species, mob_id, text)
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_FILTER_ANIMALS.format(where), (*params, limit))
+        return [self._row_to_animal(row) for row in cursor]
+
+    def count_filtered_animals(
+        self,
+        status: Optional[AnimalStatus] = None,
+        species: Optional[Species] = None,
+        mob_id: Optional[int] = None,
+        text: str = "",
+    ) -> int:
+        """Count the animals filter_animals() would return without a limit."""
+        where, params = self._animal_filter(status, species, mob_id, text)
+        return self.conn.execute(_SQL_COUNT_FILTERED_ANIMALS.format(where), params).fetchone()[0]
 
     def delete_animal(self, animal_id: int) -> None:
         """Delete an animal."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM animals WHERE id = ?", (animal_id,))
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute(_SQL_DELETE_ANIMAL, (animal_id,))
 
-    def _row_to_animal(self, row: sqlite3.Row) -> Animal:
+    def _row_to_animal(self, row: tuple) -> Animal:
         """Convert a database row to an Animal object."""
         return Animal(
-            id=row["id"],
-            eid=row["eid"],
-            visual_tag=row["visual_tag"],
-            species=Species(row["species"]),
-            breed=row["breed"],
-            sex=AnimalSex(row["sex"]),
-            date_of_birth=row["date_of_birth"],
-            status=AnimalStatus(row["status"]),
-            mob_id=row["mob_id"],
-            dam_id=row["dam_id"],
-            sire_id=row["sire_id"],
-            notes=row["notes"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
+            row[0],
+            row[1],
+            row[2],
+            _SPECIES_MAP.get(row[3]) or Species(row[3]),
+            row[4],
+            _SEX_MAP.get(row[5]) or AnimalSex(row[5]),
+            _to_date(row[6]),
+            _STATUS_MAP.get(row[7]) or AnimalStatus(row[7]),
+            row[8],
+            row[9],
+            row[10],
+            row[11],
+            _to_datetime(row[12]),
+            _to_datetime(row[13]),
         )
 
     # -------------------------------------------------------------------------
@@ -502,87 +1180,96 @@ class Database:
 
     def save_product(self, product: Product) -> Product:
         """Save a product (insert or update)."""
-        cursor = self.conn.cursor()
         now = datetime.now()
-
-        if product.id is None:
-            cursor.execute(
-                """INSERT INTO products (name, active_ingredient, category, meat_whp_days,
-                   milk_whp_days, esi_days, default_dose, default_route, notes,
-                   created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    product.name,
-                    product.active_ingredient,
-                    product.category,
-                    product.meat_whp_days,
-                    product.milk_whp_days,
-                    product.esi_days,
-                    product.default_dose,
-                    product.default_route.value,
-                    product.notes,
-                    now,
-                    now,
-                ),
-            )
-            product.id = cursor.lastrowid
-            product.created_at = now
-        else:
-            cursor.execute(
-                """UPDATE products SET name=?, active_ingredient=?, category=?, meat_whp_days=?,
-                   milk_whp_days=?, esi_days=?, default_dose=?, default_route=?, notes=?,
-                   updated_at=? WHERE id=?""",
-                (
-                    product.name,
-                    product.active_ingredient,
-                    product.category,
-                    product.meat_whp_days,
-                    product.milk_whp_days,
-                    product.esi_days,
-                    product.default_dose,
-                    product.default_route.value,
-                    product.notes,
-                    now,
-                    product.id,
-                ),
-            )
-        product.updated_at = now
-        self.conn.commit()
+        with self.transaction():
+            if product.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_PRODUCT,
+                    (
+                        product.name,
+                        product.active_ingredient,
+                        product.category,
+                        product.meat_whp_days,
+                        product.milk_whp_days,
+                        product.esi_days,
+                        product.default_dose,
+                        product.default_route.value,
+                        product.notes,
+                        now,
+                        now,
+                    ),
+                )
+                product.id = cursor.lastrowid
+                product.created_at = now
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_PRODUCT,
+                    (
+                        product.name,
+                        product.active_ingredient,
+                        product.category,
+                        product.meat_whp_days,
+                        product.milk_whp_days,
+                        product.esi_days,
+                        product.default_dose,
+                        product.default_route.value,
+                        product.notes,
+                        now,
+                        product.id,
+                    ),
+                )
+            product.updated_at = now
+        self._product_cache = None
         return product
 
     def get_product(self, product_id: int) -> Optional[Product]:
         """Get a product by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM products WHERE id = ?", (product_id,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_PRODUCT, (product_id,))
         row = cursor.fetchone()
         return self._row_to_product(row) if row else None
 
     def get_all_products(self) -> list[Product]:
         """Get all products."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM products ORDER BY name")
-        return [self._row_to_product(row) for row in cursor.fetchall()]
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_ALL_PRODUCTS)
+        return [self._row_to_product(row) for row in cursor]
+
+    @property
+    def product_cache(self) -> tuple[Product, ...]:
+        """All products, as get_all_products() returns them, read once and kept.
+
+        The product counterpart of mob_cache, dropped by save_product(),
+        delete_product(), a rolled-back transaction and restore(). Treat the
+        Product objects as read-only.
+        """
+        products = self._product_cache
+        if products is None:
+            products = tuple(self.get_all_products())
+            self._product_cache = products
+        return products
 
     def delete_product(self, product_id: int) -> None:
         """Delete a product."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM products WHERE id = ?", (product_id,))
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute(_SQL_DELETE_PRODUCT, (product_id,))
+        self._product_cache = None
 
-    def _row_to_product(self, row: sqlite3.Row) -> Product:
+    def _row_to_product(self, row: tuple) -> Product:
         """Convert a database row to a Product object."""
         return Product(
-            id=row["id"],
-            name=row["name"],
-            active_ingredient=row["active_ingredient"],
-            category=row["category"],
-            meat_whp_days=row["meat_whp_days"],
-            milk_whp_days=row["milk_whp_days"],
-            esi_days=row["esi_days"],
-            default_dose=row["default_dose"],
-            default_route=TreatmentRoute(row["default_route"]),
-            notes=row["notes"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
+            row[0],
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            row[5],
+            row[6],
+            row[7],
+            _ROUTE_MAP.get(row[8]) or TreatmentRoute(row[8]),
+            row[9],
+            _to_datetime(row[10]),
+            _to_datetime(row[11]),
         )
 
     # -------------------------------------------------------------------------
@@ -591,77 +1278,130 @@ class Database:
 
     def save_event(self, event: Event) -> Event:
         """Save a base event."""
-        cursor = self.conn.cursor()
         now = datetime.now()
+        with self.transaction():
+            if event.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_EVENT,
+                    (
+                        event.event_type.value,
+                        event.event_date,
+                        event.animal_id,
+                        event.mob_id,
+                        event.notes,
+                        event.recorded_by,
+                        now,
+                    ),
+                )
+                event.id = cursor.lastrowid
+                event.created_at = now
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_EVENT,
+                    (
+                        event.event_type.value,
+                        event.event_date,
+                        event.animal_id,
+                        event.mob_id,
+                        event.notes,
+                        event.recorded_by,
+                        event.id,
+                    ),
+                )
+        return event
 
-        if event.id is None:
-            cursor.execute(
-                """INSERT INTO events (event_type, event_date, animal_id, mob_id, notes,
-                   recorded_by, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    event.event_type.value,
-                    event.event_date,
-                    event.animal_id,
-                    event.mob_id,
-                    event.notes,
-                    event.recorded_by,
-                    now,
-                ),
+    def save_events_bulk(self, events: list[Event]) -> None:
+        """Save many base events (insert or update) in a single transaction.
+
+        Like save_animals_bulk(), newly inserted events are not given their
+        ids, so this is not suitable for events that need a detail row.
+        """
+        now = datetime.now()
+        inserts = []
+        updates = []
+        for event in events:
+            values = (
+                event.event_type.value,
+                event.event_date,
+                event.animal_id,
+                event.mob_id,
+                event.notes,
+                event.recorded_by,
             )
-            event.id = cursor.lastrowid
+            if event.id is None:
+                inserts.append(values + (now,))
+                event.created_at = now
+            else:
+                updates.append(values + (event.id,))
+
+        with self.transaction():
+            cursor = self.conn.cursor()
+            if inserts:
+                cursor.executemany(_SQL_INSERT_EVENT, inserts)
+            if updates:
+                cursor.executemany(_SQL_UPDATE_EVENT, updates)
+
+    def _insert_new_events(self, events: list[Event], event_type: EventType) -> None:
+        """Insert new events with one executemany and give each its id.
+
+        Must be called inside transaction(). The write lock is held for the
+        whole executemany and the events table is AUTOINCREMENT, so the rows
+        get consecutive ids ending at last_insert_rowid().
+        """
+        now = datetime.now()
+        rows = []
+        for event in events:
+            event.event_type = event_type
             event.created_at = now
-        else:
-            cursor.execute(
-                """UPDATE events SET event_type=?, event_date=?, animal_id=?, mob_id=?,
-                   notes=?, recorded_by=? WHERE id=?""",
+            rows.append(
                 (
-                    event.event_type.value,
+                    event_type.value,
                     event.event_date,
                     event.animal_id,
                     event.mob_id,
                     event.notes,
                     event.recorded_by,
-                    event.id,
-                ),
+                    now,
+                )
             )
-        self.conn.commit()
-        return event
+
+        self.conn.executemany(_SQL_INSERT_EVENT, rows)
+        first_id = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0] - len(rows) + 1
+        for event_id, event in enumerate(events, first_id):
+            event.id = event_id
 
     def save_movement_event(
         self, event: Event, movement: MovementEvent
     ) -> tuple[Event, MovementEvent]:
         """Save a movement event with its details."""
         event.event_type = EventType.MOVEMENT
-        event = self.save_event(event)
-
-        cursor = self.conn.cursor()
-        if movement.id is None:
-            cursor.execute(
-                """INSERT INTO movement_events (event_id, from_paddock_id, to_paddock_id,
-                   reason, head_count) VALUES (?, ?, ?, ?, ?)""",
-                (
-                    event.id,
-                    movement.from_paddock_id,
-                    movement.to_paddock_id,
-                    movement.reason,
-                    movement.head_count,
-                ),
-            )
-            movement.id = cursor.lastrowid
-            movement.event_id = event.id
-        else:
-            cursor.execute(
-                """UPDATE movement_events SET from_paddock_id=?, to_paddock_id=?, reason=?,
-                   head_count=? WHERE id=?""",
-                (
-                    movement.from_paddock_id,
-                    movement.to_paddock_id,
-                    movement.reason,
-                    movement.head_count,
-                    movement.id,
-                ),
-            )
-        self.conn.commit()
+        with self.transaction():
+            event = self.save_event(event)
+
+            if movement.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_MOVEMENT,
+                    (
+                        event.id,
+                        movement.from_paddock_id,
+                        movement.to_paddock_id,
+                        movement.reason,
+                        movement.head_count,
+                    ),
+                )
+                movement.id = cursor.lastrowid
+                movement.event_id = event.id
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_MOVEMENT,
+                    (
+                        movement.from_paddock_id,
+                        movement.to_paddock_id,
+                        movement.reason,
+                        movement.head_count,
+                        movement.id,
+                    ),
+                )
         return event, movement
 
     def save_treatment_event(
@@ -669,177 +1409,271 @@ class Database:
     ) -> tuple[Event, TreatmentEvent]:
         """Save a treatment event with its details."""
         event.event_type = EventType.TREATMENT
-        event = self.save_event(event)
-
-        cursor = self.conn.cursor()
-        if treatment.id is None:
-            cursor.execute(
-                """INSERT INTO treatment_events (event_id, product_id, batch_number, dose,
-                   route, administered_by, meat_whp_end, milk_whp_end, esi_end)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    event.id,
-                    treatment.product_id,
-                    treatment.batch_number,
-                    treatment.dose,
-                    treatment.route.value,
-                    treatment.administered_by,
-                    treatment.meat_whp_end,
-                    treatment.milk_whp_end,
-                    treatment.esi_end,
-                ),
-            )
-            treatment.id = cursor.lastrowid
-            treatment.event_id = event.id
-        else:
-            cursor.execute(
-                """UPDATE treatment_events SET product_id=?, batch_number=?, dose=?, route=?,
-                   administered_by=?, meat_whp_end=?, milk_whp_end=?, esi_end=? WHERE id=?""",
-                (
-                    treatment.product_id,
-                    treatment.batch_number,
-                    treatment.dose,
-                    treatment.route.value,
-                    treatment.administered_by,
-                    treatment.meat_whp_end,
-                    treatment.milk_whp_end,
-                    treatment.esi_end,
-                    treatment.id,
-                ),
-            )
-        self.conn.commit()
+        with self.transaction():
+            event = self.save_event(event)
+
+            if treatment.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_TREATMENT,
+                    (
+                        event.id,
+                        treatment.product_id,
+                        treatment.batch_number,
+                        treatment.dose,
+                        treatment.route.value,
+                        treatment.administered_by,
+                        treatment.meat_whp_end,
+                        treatment.milk_whp_end,
+                        treatment.esi_end,
+                    ),
+                )
+                treatment.id = cursor.lastrowid
+                treatment.event_id = event.id
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_TREATMENT,
+                    (
+                        treatment.product_id,
+                        treatment.batch_number,
+                        treatment.dose,
+                        treatment.route.value,
+                        treatment.administered_by,
+                        treatment.meat_whp_end,
+                        treatment.milk_whp_end,
+                        treatment.esi_end,
+                        treatment.id,
+                    ),
+                )
         return event, treatment
 
     def save_weigh_event(self, event: Event, weigh: WeighEvent) -> tuple[Event, WeighEvent]:
         """Save a weigh event with its details."""
         event.event_type = EventType.WEIGH
-        event = self.save_event(event)
+        with self.transaction():
+            event = self.save_event(event)
+
+            if weigh.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_WEIGH,
+                    (event.id, weigh.weight_kg, weigh.condition_score),
+                )
+                weigh.id = cursor.lastrowid
+                weigh.event_id = event.id
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_WEIGH,
+                    (weigh.weight_kg, weigh.condition_score, weigh.id),
+                )
+        return event, weigh
 
-        cursor = self.conn.cursor()
-        if weigh.id is None:
-            cursor.execute(
-                """INSERT INTO weigh_events (event_id, weight_kg, condition_score)
-                   VALUES (?, ?, ?)""",
-                (event.id, weigh.weight_kg, weigh.condition_score),
-            )
-            weigh.id = cursor.lastrowid
-            weigh.event_id = event.id
-        else:
-            cursor.execute(
-                "UPDATE weigh_events SET weight_kg=?, condition_score=? WHERE id=?",
-                (weigh.weight_kg, weigh.condition_score, weigh.id),
+    def save_treatment_events_bulk(
+        self, events_and_treatments: list[tuple[Event, TreatmentEvent]]
+    ) -> None:
+        """Insert many new treatment events, with their details, in one transaction.
+
+        The events and the detail rows each go through one executemany. The
+        events are given their ids and each treatment its event_id; the
+        treatments' own ids are not filled in.
+        """
+        if not events_and_treatments:
+            return
+        with self.transaction():
+            self._insert_new_events(
+                [event for event, _ in events_and_treatments], EventType.TREATMENT
             )
-        self.conn.commit()
-        return event, weigh
+            rows = []
+            for event, treatment in events_and_treatments:
+                treatment.event_id = event.id
+                rows.append(
+                    (
+                        event.id,
+                        treatment.product_id,
+                        treatment.batch_number,
+                        treatment.dose,
+                        treatment.route.value,
+                        treatment.administered_by,
+                        treatment.meat_whp_end,
+                        treatment.milk_whp_end,
+                        treatment.esi_end,
+                    )
+                )
+            self.conn.executemany(_SQL_INSERT_TREATMENT, rows)
+
+    def save_weigh_events_bulk(self, events_and_weighs: list[tuple[Event, WeighEvent]]) -> None:
+        """Insert many new weigh events, with their details, in one transaction.
+
+        Like save_treatment_events_bulk(), the weighs' own ids are not filled in.
+        """
+        if not events_and_weighs:
+            return
+        with self.transaction():
+            self._insert_new_events([event for event, _ in events_and_weighs], EventType.WEIGH)
+            rows = []
+            for event, weigh in events_and_weighs:
+                weigh.event_id = event.id
+                rows.append((event.id, weigh.weight_kg, weigh.condition_score))
+            self.conn.executemany(_SQL_INSERT_WEIGH, rows)
 
     def get_events_for_animal(
         self, animal_id: int, event_type: Optional[EventType] = None
     ) -> list[Event]:
         """Get events for an animal."""
-        cursor = self.conn.cursor()
+        cursor = self._tuple_cursor()
         if event_type:
             cursor.execute(
-                """SELECT * FROM events WHERE animal_id = ? AND event_type = ?
-                   ORDER BY event_date DESC""",
+                _SQL_SELECT_ANIMAL_EVENTS_BY_TYPE,
                 (animal_id, event_type.value),
             )
         else:
-            cursor.execute(
-                "SELECT * FROM events WHERE animal_id = ? ORDER BY event_date DESC",
-                (animal_id,),
-            )
-        return [self._row_to_event(row) for row in cursor.fetchall()]
+            cursor.execute(_SQL_SELECT_ANIMAL_EVENTS, (animal_id,))
+        return [self._row_to_event(row) for row in cursor]
 
     def get_events_for_mob(
         self, mob_id: int, event_type: Optional[EventType] = None
     ) -> list[Event]:
         """Get events for a mob."""
-        cursor = self.conn.cursor()
+        cursor = self._tuple_cursor()
         if event_type:
             cursor.execute(
-                """SELECT * FROM events WHERE mob_id = ? AND event_type = ?
-                   ORDER BY event_date DESC""",
+                _SQL_SELECT_MOB_EVENTS_BY_TYPE,
                 (mob_id, event_type.value),
             )
         else:
-            cursor.execute(
-                "SELECT * FROM events WHERE mob_id = ? ORDER BY event_date DESC",
-                (mob_id,),
-            )
-        return [self._row_to_event(row) for row in cursor.fetchall()]
+            cursor.execute(_SQL_SELECT_MOB_EVENTS, (mob_id,))
+        return [self._row_to_event(row) for row in cursor]
 
     def get_recent_events(self, limit: int = 50) -> list[Event]:
         """Get recent events across all animals/mobs."""
-        cursor = self.conn.cursor()
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_RECENT_EVENTS, (limit,))
+        return [self._row_to_event(row) for row in cursor]
+
+    def get_events_by_type_in_range(
+        self, event_type: EventType, from_date: date, to_date: date
+    ) -> list[Event]:
+        """Get events of one type dated from_date to to_date inclusive, newest first."""
+        cursor = self._tuple_cursor()
         cursor.execute(
-            "SELECT * FROM events ORDER BY event_date DESC, created_at DESC LIMIT ?",
-            (limit,),
+            _SQL_SELECT_EVENTS_BY_TYPE_IN_RANGE,
+            (event_type.value, from_date, to_date),
         )
-        return [self._row_to_event(row) for row in cursor.fetchall()]
+        return [self._row_to_event(row) for row in cursor]
+
+    def get_events_with_details_for_animal(
+        self, animal_id: int
+    ) -> list[tuple[Event, Optional[Union[TreatmentEvent, MovementEvent, WeighEvent]]]]:
+        """Get events for an animal, each paired with its detail record.
+
+        Reads the events_full view, so the details come from the same query
+        rather than one get_*_details call per event. Event types without a
+        detail table are paired with None.
+        """
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_ANIMAL_EVENTS_FULL, (animal_id,))
+        return [self._row_to_event_with_details(row) for row in cursor]
 
     def get_treatment_details(self, event_id: int) -> Optional[TreatmentEvent]:
         """Get treatment details for an event."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM treatment_events WHERE event_id = ?", (event_id,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_TREATMENT, (event_id,))
         row = cursor.fetchone()
-        if row:
-            return TreatmentEvent(
-                id=row["id"],
-                event_id=row["event_id"],
-                product_id=row["product_id"],
-                batch_number=row["batch_number"],
-                dose=row["dose"],
-                route=TreatmentRoute(row["route"]) if row["route"] else TreatmentRoute.OTHER,
-                administered_by=row["administered_by"],
-                meat_whp_end=row["meat_whp_end"],
-                milk_whp_end=row["milk_whp_end"],
-                esi_end=row["esi_end"],
-            )
-        return None
+        return self._row_to_treatment(row) if row else None
 
     def get_movement_details(self, event_id: int) -> Optional[MovementEvent]:
         """Get movement details for an event."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM movement_events WHERE event_id = ?", (event_id,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_MOVEMENT, (event_id,))
         row = cursor.fetchone()
-        if row:
-            return MovementEvent(
-                id=row["id"],
-                event_id=row["event_id"],
-                from_paddock_id=row["from_paddock_id"],
-                to_paddock_id=row["to_paddock_id"],
-                reason=row["reason"],
-                head_count=row["head_count"],
-            )
-        return None
+        return MovementEvent(*row) if row else None
 
     def get_weigh_details(self, event_id: int) -> Optional[WeighEvent]:
         """Get weigh details for an event."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM weigh_events WHERE event_id = ?", (event_id,))
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_WEIGH, (event_id,))
         row = cursor.fetchone()
-        if row:
-            return WeighEvent(
-                id=row["id"],
-                event_id=row["event_id"],
-                weight_kg=row["weight_kg"],
-                condition_score=row["condition_score"],
-            )
-        return None
+        return WeighEvent(*row) if row else None
+
+    def get_treatment_details_by_event_ids(
+        self, event_ids: Iterable[int]
+    ) -> dict[int, TreatmentEvent]:
+        """Get treatment details keyed by event ID, for many events at once."""
+        return {
+            row[1]: self._row_to_treatment(row)
+            for row in self._select_by_ids(_SQL_SELECT_TREATMENTS_BY_EVENT_IDS, event_ids)
+        }
+
+    def get_movement_details_by_event_ids(
+        self, event_ids: Iterable[int]
+    ) -> dict[int, MovementEvent]:
+        """Get movement details keyed by event ID, for many events at once."""
+        return {
+            row[1]: MovementEvent(*row)
+            for row in self._select_by_ids(_SQL_SELECT_MOVEMENTS_BY_EVENT_IDS, event_ids)
+        }
+
+    def get_weigh_details_by_event_ids(self, event_ids: Iterable[int]) -> dict[int, WeighEvent]:
+        """Get weigh details keyed by event ID, for many events at once."""
+        return {
+            row[1]: WeighEvent(*row)
+            for row in self._select_by_ids(_SQL_SELECT_WEIGHS_BY_EVENT_IDS, event_ids)
+        }
+
+    def _row_to_treatment(self, row: tuple) -> TreatmentEvent:
+        """Convert a database row to a TreatmentEvent object."""
+        return TreatmentEvent(
+            row[0],
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            (_ROUTE_MAP.get(row[5]) or TreatmentRoute(row[5])) if row[5] else TreatmentRoute.OTHER,
+            row[6],
+            _to_date(row[7]),
+            _to_date(row[8]),
+            _to_date(row[9]),
+        )
 
-    def _row_to_event(self, row: sqlite3.Row) -> Event:
+    def _row_to_event(self, row: tuple) -> Event:
         """Convert a database row to an Event object."""
         return Event(
-            id=row["id"],
-            event_type=EventType(row["event_type"]),
-            event_date=row["event_date"],
-            animal_id=row["animal_id"],
-            mob_id=row["mob_id"],
-            notes=row["notes"],
-            recorded_by=row["recorded_by"],
-            created_at=row["created_at"],
+            row[0],
+            _EVENT_TYPE_MAP.get(row[1]) or EventType(row[1]),
+            _to_date(row[2]),
+            row[3],
+            row[4],
+            row[5],
+            row[6],
+            _to_datetime(row[7]),
         )
 
+    def _row_to_event_with_details(
+        self, row: tuple
+    ) -> tuple[Event, Optional[Union[TreatmentEvent, MovementEvent, WeighEvent]]]:
+        """Convert an events_full row to an Event and its detail object."""
+        event = self._row_to_event(row)
+        event_type = event.event_type
+        details = None
+        if event_type is EventType.TREATMENT and row[8] is not None:
+            details = TreatmentEvent(
+                row[8],
+                row[0],
+                row[9],
+                row[10],
+                row[11],
+                (_ROUTE_MAP.get(row[12]) or TreatmentRoute(row[12]))
+                if row[12]
+                else TreatmentRoute.OTHER,
+                row[13],
+                _to_date(row[14]),
+                _to_date(row[15]),
+                _to_date(row[16]),
+            )
+        elif event_type is EventType.MOVEMENT and row[17] is not None:
+            details = MovementEvent(row[17], row[0], row[18], row[19], row[20], row[21])
+        elif event_type is EventType.WEIGH and row[22] is not None:
+            details = WeighEvent(row[22], row[0], row[23], row[24])
+        return event, details
+
     # -------------------------------------------------------------------------
     # WHP (Withholding Period) queries
     # -------------------------------------------------------------------------
@@ -847,46 +1681,62 @@ class Database:
     def get_animals_on_whp(self, as_of_date: Optional[date] = None) -> list[dict]:
         """Get animals currently under withholding period.
 
-        Returns list of dicts with animal, event, treatment, and product info.
+        Returns list of dicts with animal, event, treatment, and product info,
+        plus days_left: days from as_of_date to the meat WHP end, or None.
         """
         if as_of_date is None:
             as_of_date = date.today()
 
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT
-                a.id as animal_id, a.eid, a.visual_tag,
-                e.id as event_id, e.event_date,
-                t.meat_whp_end, t.milk_whp_end, t.esi_end,
-                p.name as product_name
-            FROM treatment_events t
-            JOIN events e ON t.event_id = e.id
-            JOIN animals a ON e.animal_id = a.id
-            LEFT JOIN products p ON t.product_id = p.id
-            WHERE a.status = 'alive'
-              AND (t.meat_whp_end >= ? OR t.milk_whp_end >= ? OR t.esi_end >= ?)
-            ORDER BY t.meat_whp_end, a.visual_tag
-            """,
-            (as_of_date, as_of_date, as_of_date),
-        )
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_ANIMALS_ON_WHP, (as_of_date, as_of_date))
+        return [
+            {
+                "animal_id": row[0],
+                "eid": row[1],
+                "visual_tag": row[2],
+                "event_id": row[3],
+                "event_date": _to_date(row[4]),
+                "meat_whp_end": _to_date(row[5]),
+                "milk_whp_end": _to_date(row[6]),
+                "esi_end": _to_date(row[7]),
+                "product_name": row[8],
+                "days_left": row[9],
+            }
+            for row in cursor
+        ]
+
+    def get_sale_ready_animals(self, as_of_date: Optional[date] = None) -> list[Animal]:
+        """Get alive animals that are not under any withholding period."""
+        if as_of_date is None:
+            as_of_date = date.today()
 
-        results = []
-        for row in cursor.fetchall():
-            results.append(
-                {
-                    "animal_id": row["animal_id"],
-                    "eid": row["eid"],
-                    "visual_tag": row["visual_tag"],
-                    "event_id": row["event_id"],
-                    "event_date": row["event_date"],
-                    "meat_whp_end": row["meat_whp_end"],
-                    "milk_whp_end": row["milk_whp_end"],
-                    "esi_end": row["esi_end"],
-                    "product_name": row["product_name"],
-                }
-            )
-        return results
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_SALE_READY_ANIMALS, (as_of_date,))
+        return [self._row_to_animal(row) for row in cursor]
+
+    # -------------------------------------------------------------------------
+    # Report queries
+    # -------------------------------------------------------------------------
+
+    def get_treatment_register_rows(self, from_date: date, to_date: date) -> list[tuple]:
+        """Get treatment register rows for a date range, newest first.
+
+        Each row is (date, identifier, product, dose, batch, meat WHP end,
+        administered by) as display strings, dates as DD/MM/YYYY.
+        """
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_TREATMENT_REGISTER, (from_date, to_date))
+        return cursor.fetchall()
+
+    def get_movement_log_rows(self, from_date: date, to_date: date) -> list[tuple]:
+        """Get movement log rows for a date range, newest first.
+
+        Each row is (date, identifier, from paddock, to paddock, reason, head
+        count) as display strings, with "-" for missing values.
+        """
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_MOVEMENT_LOG, (from_date, to_date))
+        return cursor.fetchall()
 
     # -------------------------------------------------------------------------
     # Task operations
@@ -894,89 +1744,104 @@ class Database:
 
     def save_task(self, task: Task) -> Task:
         """Save a task."""
-        cursor = self.conn.cursor()
         now = datetime.now()
+        with self.transaction():
+            if task.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_TASK,
+                    (
+                        task.title,
+                        task.description,
+                        task.due_date,
+                        task.source_event_id,
+                        task.animal_id,
+                        task.mob_id,
+                        1 if task.completed else 0,
+                        task.completed_at,
+                        now,
+                    ),
+                )
+                task.id = cursor.lastrowid
+                task.created_at = now
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_TASK,
+                    (
+                        task.title,
+                        task.description,
+                        task.due_date,
+                        task.source_event_id,
+                        task.animal_id,
+                        task.mob_id,
+                        1 if task.completed else 0,
+                        task.completed_at,
+                        task.id,
+                    ),
+                )
+        return task
 
-        if task.id is None:
-            cursor.execute(
-                """INSERT INTO tasks (title, description, due_date, source_event_id,
-                   animal_id, mob_id, completed, completed_at, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    task.title,
-                    task.description,
-                    task.due_date,
-                    task.source_event_id,
-                    task.animal_id,
-                    task.mob_id,
-                    1 if task.completed else 0,
-                    task.completed_at,
-                    now,
-                ),
-            )
-            task.id = cursor.lastrowid
-            task.created_at = now
-        else:
-            cursor.execute(
-                """UPDATE tasks SET title=?, description=?, due_date=?, source_event_id=?,
-                   animal_id=?, mob_id=?, completed=?, completed_at=? WHERE id=?""",
-                (
-                    task.title,
-                    task.description,
-                    task.due_date,
-                    task.source_event_id,
-                    task.animal_id,
-                    task.mob_id,
-                    1 if task.completed else 0,
-                    task.completed_at,
-                    task.id,
-                ),
+    def save_tasks_bulk(self, tasks: list[Task]) -> None:
+        """Save many tasks (insert or update) in a single transaction.
+
+        Like save_animals_bulk(), newly inserted tasks are not given their ids.
+        """
+        now = datetime.now()
+        inserts = []
+        updates = []
+        for task in tasks:
+            values = (
+                task.title,
+                task.description,
+                task.due_date,
+                task.source_event_id,
+                task.animal_id,
+                task.mob_id,
+                1 if task.completed else 0,
+                task.completed_at,
             )
-        self.conn.commit()
-        return task
+            if task.id is None:
+                inserts.append(values + (now,))
+                task.created_at = now
+            else:
+                updates.append(values + (task.id,))
+
+        with self.transaction():
+            cursor = self.conn.cursor()
+            if inserts:
+                cursor.executemany(_SQL_INSERT_TASK, inserts)
+            if updates:
+                cursor.executemany(_SQL_UPDATE_TASK, updates)
 
     def get_pending_tasks(self, days_ahead: int = 7) -> list[Task]:
         """Get pending tasks due within the specified days."""
-        cursor = self.conn.cursor()
-        from datetime import timedelta
-
         end_date = date.today() + timedelta(days=days_ahead)
-        cursor.execute(
-            """SELECT * FROM tasks
-               WHERE completed = 0 AND (due_date IS NULL OR due_date <= ?)
-               ORDER BY due_date NULLS LAST, created_at""",
-            (end_date,),
-        )
-        return [self._row_to_task(row) for row in cursor.fetchall()]
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_PENDING_TASKS, (end_date,))
+        return [self._row_to_task(row) for row in cursor]
 
     def complete_task(self, task_id: int) -> None:
         """Mark a task as completed."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "UPDATE tasks SET completed = 1, completed_at = ? WHERE id = ?",
-            (datetime.now(), task_id),
-        )
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute(_SQL_COMPLETE_TASK, (datetime.now(), task_id))
 
     def delete_task(self, task_id: int) -> None:
         """Delete a task."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute(_SQL_DELETE_TASK, (task_id,))
 
-    def _row_to_task(self, row: sqlite3.Row) -> Task:
+    def _row_to_task(self, row: tuple) -> Task:
         """Convert a database row to a Task object."""
         return Task(
-            id=row["id"],
-            title=row["title"],
-            description=row["description"],
-            due_date=row["due_date"],
-            source_event_id=row["source_event_id"],
-            animal_id=row["animal_id"],
-            mob_id=row["mob_id"],
-            completed=bool(row["completed"]),
-            completed_at=row["completed_at"],
-            created_at=row["created_at"],
+            row[0],
+            row[1],
+            row[2],
+            _to_date(row[3]),
+            row[4],
+            row[5],
+            row[6],
+            bool(row[7]),
+            _to_datetime(row[8]),
+            _to_datetime(row[9]),
         )
 
     # -------------------------------------------------------------------------
@@ -985,62 +1850,58 @@ class Database:
 
     def get_property_settings(self) -> Optional[PropertySettings]:
         """Get property settings (creates default if none exist)."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM property_settings LIMIT 1")
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_SELECT_SETTINGS)
         row = cursor.fetchone()
         if row:
             return PropertySettings(
-                id=row["id"],
-                property_name=row["property_name"],
-                pic=row["pic"],
-                owner_name=row["owner_name"],
-                address=row["address"],
-                phone=row["phone"],
-                email=row["email"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
+                row[0],
+                row[1],
+                row[2],
+                row[3],
+                row[4],
+                row[5],
+                row[6],
+                _to_datetime(row[7]),
+                _to_datetime(row[8]),
             )
         return None
 
     def save_property_settings(self, settings: PropertySettings) -> PropertySettings:
         """Save property settings."""
-        cursor = self.conn.cursor()
         now = datetime.now()
-
-        if settings.id is None:
-            cursor.execute(
-                """INSERT INTO property_settings (property_name, pic, owner_name, address,
-                   phone, email, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    settings.property_name,
-                    settings.pic,
-                    settings.owner_name,
-                    settings.address,
-                    settings.phone,
-                    settings.email,
-                    now,
-                    now,
-                ),
-            )
-            settings.id = cursor.lastrowid
-            settings.created_at = now
-        else:
-            cursor.execute(
-                """UPDATE property_settings SET property_name=?, pic=?, owner_name=?,
-                   address=?, phone=?, email=?, updated_at=? WHERE id=?""",
-                (
-                    settings.property_name,
-                    settings.pic,
-                    settings.owner_name,
-                    settings.address,
-                    settings.phone,
-                    settings.email,
-                    now,
-                    settings.id,
-                ),
-            )
-        settings.updated_at = now
-        self.conn.commit()
+        with self.transaction():
+            if settings.id is None:
+                cursor = self.conn.execute(
+                    _SQL_INSERT_SETTINGS,
+                    (
+                        settings.property_name,
+                        settings.pic,
+                        settings.owner_name,
+                        settings.address,
+                        settings.phone,
+                        settings.email,
+                        now,
+                        now,
+                    ),
+                )
+                settings.id = cursor.lastrowid
+                settings.created_at = now
+            else:
+                self.conn.execute(
+                    _SQL_UPDATE_SETTINGS,
+                    (
+                        settings.property_name,
+                        settings.pic,
+                        settings.owner_name,
+                        settings.address,
+                        settings.phone,
+                        settings.email,
+                        now,
+                        settings.id,
+                    ),
+                )
+            settings.updated_at = now
         return settings
 
     # -------------------------------------------------------------------------
@@ -1049,20 +1910,15 @@ class Database:
 
     def get_animal_counts(self) -> dict[str, int]:
         """Get counts of animals by status."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """SELECT status, COUNT(*) as count FROM animals GROUP BY status"""
-        )
-        return {row["status"]: row["count"] for row in cursor.fetchall()}
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_COUNT_ANIMALS_BY_STATUS)
+        return dict(cursor)
 
     def get_species_counts(self) -> dict[str, int]:
         """Get counts of alive animals by species."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """SELECT species, COUNT(*) as count FROM animals
-               WHERE status = 'alive' GROUP BY species"""
-        )
-        return {row["species"]: row["count"] for row in cursor.fetchall()}
+        cursor = self._tuple_cursor()
+        cursor.execute(_SQL_COUNT_ALIVE_BY_SPECIES)
+        return dict(cursor)
 
     # -------------------------------------------------------------------------
     # Backup and restore
@@ -1070,11 +1926,25 @@ class Database:
 
     def backup(self, backup_path: Path) -> None:
         """Create a backup of the database."""
-        self.conn.commit()  # Ensure all changes are written
-        shutil.copy2(self.db_path, backup_path)
+        # The online backup API copies a consistent snapshot of all committed
+        # data, including pages still in the WAL, without closing the database.
+        target = sqlite3.connect(backup_path)
+        try:
+            self.conn.backup(target)
+        finally:
+            target.close()
 
     def restore(self, backup_path: Path) -> None:
         """Restore database from a backup."""
-        self.close()
-        shutil.copy2(backup_path, self.db_path)
-        self.connect()
+        # Copy the backup's pages into the open connection rather than replacing
+        # the file underneath it, which would also leave a stale WAL behind.
+        source = sqlite3.connect(backup_path)
+        try:
+            source.backup(self.conn)
+        finally:
+            source.close()
+        # The backup may come from an older version of the schema
+        self._init_schema()
+        self._mob_cache = None
+        self._product_cache = None
+        self._commit_count += 1
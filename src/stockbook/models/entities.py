@@ -58,7 +58,7 @@ class TreatmentRoute(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class Paddock:
     """A paddock or pasture area on the property."""
 
@@ -71,7 +71,7 @@ class Paddock:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Mob:
     """A mob (group) of animals managed together."""
 
@@ -84,7 +84,7 @@ class Mob:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Animal:
     """An individual animal in the herd/flock."""
 
@@ -109,7 +109,7 @@ class Animal:
         return self.visual_tag or self.eid or f"#{self.id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """A treatment product (drench, vaccine, etc.)."""
 
@@ -127,7 +127,7 @@ class Product:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Base event record for all animal events."""
 
@@ -141,7 +141,7 @@ class Event:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MovementEvent:
     """A movement of animals between paddocks."""
 
@@ -153,7 +153,7 @@ class MovementEvent:
     head_count: int = 0  # Number of animals moved (for mob moves)
 
 
-@dataclass
+@dataclass(slots=True)
 class TreatmentEvent:
     """A treatment administered to an animal or mob."""
 
@@ -169,7 +169,7 @@ class TreatmentEvent:
     esi_end: Optional[date] = None  # Calculated ESI end date
 
 
-@dataclass
+@dataclass(slots=True)
 class WeighEvent:
     """A weight recording for an animal."""
 
@@ -179,7 +179,7 @@ class WeighEvent:
     condition_score: Optional[float] = None  # Body condition score (1-5)
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A reminder or task generated from events."""
 
@@ -195,7 +195,7 @@ class Task:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertySettings:
     """Property-level settings and information."""
 
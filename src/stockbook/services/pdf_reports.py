@@ -2,13 +2,20 @@
 
 from datetime import date
 from pathlib import Path
+from typing import Iterable, Optional, Sequence
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import mm
+from reportlab.lib.units import inch, mm
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import (
-    SimpleDocTemplate,
+    BaseDocTemplate,
+    Frame,
+    LongTable,
+    PageTemplate,
     Table,
     TableStyle,
     Paragraph,
@@ -17,7 +24,168 @@ from reportlab.platypus import (
 )
 
 from stockbook.models.database import Database
-from stockbook.models.entities import AnimalStatus, EventType
+from stockbook.models.entities import AnimalSex, AnimalStatus, EventType, Species
+
+
+# Styles are built once at import and shared by every report, rather than
+# rebuilt for each ReportGenerator or table.
+_STYLES = getSampleStyleSheet()
+_STYLES.add(
+    ParagraphStyle(
+        name="ReportTitle",
+        parent=_STYLES["Heading1"],
+        fontSize=18,
+        spaceAfter=12,
+    )
+)
+_STYLES.add(
+    ParagraphStyle(
+        name="ReportSubtitle",
+        parent=_STYLES["Normal"],
+        fontSize=10,
+        textColor=colors.black,
+        spaceAfter=20,
+    )
+)
+
+_WARNING_STYLE = ParagraphStyle(
+    name="Warning",
+    parent=_STYLES["Normal"],
+    textColor=colors.red,
+    fontSize=10,
+    spaceAfter=15,
+)
+_SUCCESS_STYLE = ParagraphStyle(
+    name="Success",
+    parent=_STYLES["Normal"],
+    textColor=colors.green,
+    fontSize=12,
+)
+
+_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2c3e50")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("TOPPADDING", (0, 0), (-1, 0), 8),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+        ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 1), (-1, -1), 9),
+        ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
+        ("TOPPADDING", (0, 1), (-1, -1), 6),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f8f9fa")]),
+    ]
+)
+
+# Tables longer than this are built as LongTable, which lays rows out page by
+# page instead of measuring the whole table before splitting it
+_LONG_TABLE_ROWS = 100
+
+# Row layout for tables drawn straight onto the canvas (_run_tabular_canvas).
+# A row is _CANVAS_ROW_HEIGHT tall for one line of text and grows by
+# _CANVAS_LEADING for each extra line a wrapped cell needs.
+_CANVAS_ROW_HEIGHT = 15
+_CANVAS_LEADING = 11
+_CANVAS_FONT_SIZE = 9
+_CANVAS_CELL_PADDING = 4
+
+# Display names for the enums shown in animal lists, looked up per row
+_SPECIES_LABEL = {species: species.value.title() for species in Species}
+_SEX_LABEL = {sex: sex.value.title() for sex in AnimalSex}
+_STATUS_LABEL = {status: status.value.title() for status in AnimalStatus}
+
+
+def _wrap_text(text: str, width: float, font_name: str, font_size: float) -> list[str]:
+    """Split text into lines no wider than width points.
+
+    Lines break between words; a word wider than the column on its own is
+    broken between characters, so no text is ever dropped.
+    """
+    lines = []
+    for line in simpleSplit(text, font_name, font_size, width) or [""]:
+        while stringWidth(line, font_name, font_size) > width and len(line) > 1:
+            end = len(line) - 1
+            while end > 1 and stringWidth(line[:end], font_name, font_size) > width:
+                end -= 1
+            lines.append(line[:end])
+            line = line[end:]
+        lines.append(line)
+    return lines
+
+
+def _draw_tabular_canvas(
+    canvas: Canvas,
+    rows: Sequence[Sequence[list[str]]],
+    row_heights: Sequence[float],
+    col_x_positions: list[float],
+    col_widths: list[float],
+    top: float,
+    font_size: float,
+) -> None:
+    """Draw one page of a table with its header row, top edge at top.
+
+    rows[0] is drawn as the header. Each cell is a list of lines already
+    wrapped to its column width, drawn one drawString per line, and the grid
+    is drawn in one call.
+    """
+    right = col_x_positions[-1] + col_widths[-1]
+    left = col_x_positions[0]
+    row_tops = [top]
+    for height in row_heights:
+        row_tops.append(row_tops[-1] - height)
+
+    canvas.saveState()
+    canvas.setFillColor(colors.HexColor("#2c3e50"))
+    canvas.rect(left, row_tops[1], right - left, row_heights[0], stroke=0, fill=1)
+    canvas.setFillColor(colors.HexColor("#f8f9fa"))
+    for i in range(2, len(rows), 2):
+        canvas.rect(left, row_tops[i + 1], right - left, row_heights[i], stroke=0, fill=1)
+
+    first_baseline = (_CANVAS_ROW_HEIGHT + font_size) / 2 - 1
+    for i, row in enumerate(rows):
+        if i == 0:
+            font_name = "Helvetica-Bold"
+            canvas.setFillColor(colors.white)
+        elif i == 1:
+            font_name = "Helvetica"
+            canvas.setFillColor(colors.black)
+        canvas.setFont(font_name, font_size)
+        for x, lines in zip(col_x_positions, row):
+            y = row_tops[i] - first_baseline
+            for line in lines:
+                canvas.drawString(x + _CANVAS_CELL_PADDING, y, line)
+                y -= _CANVAS_LEADING
+
+    canvas.setStrokeColor(colors.grey)
+    canvas.setLineWidth(0.5)
+    canvas.grid(col_x_positions + [right], row_tops)
+    canvas.restoreState()
+
+
+class _ReportDocument(BaseDocTemplate):
+    """A4 document with a single frame and the generation date on every page.
+
+    The footer is drawn straight onto each page's canvas rather than added
+    as a flowable at the end of the story.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(str(path), pagesize=A4)
+        self.footer_text = f"Generated: {date.today().strftime('%d/%m/%Y')}"
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id="main")
+        self.addPageTemplates([PageTemplate(id="main", frames=[frame], onPage=self._draw_footer)])
+
+    def _draw_footer(self, canvas, doc) -> None:
+        """Draw the footer line below the frame."""
+        canvas.saveState()
+        canvas.setFont("Helvetica", 9)
+        canvas.drawString(self.leftMargin, self.bottomMargin / 2, self.footer_text)
+        canvas.restoreState()
 
 
 class ReportGenerator:
@@ -25,467 +193,366 @@ class ReportGenerator:
 
     def __init__(self, db: Database):
         self.db = db
-        self.styles = getSampleStyleSheet()
-
-        # Custom styles
-        self.styles.add(
-            ParagraphStyle(
-                name="ReportTitle",
-                parent=self.styles["Heading1"],
-                fontSize=18,
-                spaceAfter=12,
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="ReportSubtitle",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                textColor=colors.black,
-                spaceAfter=20,
-            )
-        )
+        self.styles = _STYLES
+
+        # Lookups shared by reports generated in one session; see invalidate()
+        self._property_header: Optional[list] = None
+        self._mob_names: Optional[dict[int, str]] = None
+
+    def invalidate(self) -> None:
+        """Drop cached lookups so the next report reads them again."""
+        self._property_header = None
+        self._mob_names = None
+
+    def _get_mob_names(self) -> dict[int, str]:
+        """Get mob names keyed by ID, loading them on first use."""
+        mob_names = self._mob_names
+        if mob_names is None:
+            mob_names = {m.id: m.name for m in self.db.get_all_mobs()}
+            self._mob_names = mob_names
+        return mob_names
 
     def _get_property_header(self) -> list:
-        """Get property information for report header."""
-        settings = self.db.get_property_settings()
-        elements = []
+        """Get property information for report header.
+
+        The flowables are built on first use and reused by later reports;
+        a new list is returned each time since callers append to it.
+        """
+        elements = self._property_header
+        if elements is None:
+            settings = self.db.get_property_settings()
+            elements = []
 
-        if settings and settings.property_name:
-            elements.append(Paragraph(settings.property_name, self.styles["Heading2"]))
-            if settings.pic:
-                elements.append(Paragraph(f"PIC: {settings.pic}", self.styles["Normal"]))
+            if settings and settings.property_name:
+                elements.append(Paragraph(settings.property_name, self.styles["Heading2"]))
+                if settings.pic:
+                    elements.append(Paragraph(f"PIC: {settings.pic}", self.styles["Normal"]))
 
-        return elements
+            self._property_header = elements
+
+        return list(elements)
 
     def _create_table(
         self, data: list[list], col_widths: list[float] = None
     ) -> Table:
-        """Create a styled table."""
-        table = Table(data, colWidths=col_widths)
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2c3e50")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                    ("TOPPADDING", (0, 0), (-1, 0), 8),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                    ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
-                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -1), 9),
-                    ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
-                    ("TOPPADDING", (0, 1), (-1, -1), 6),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f8f9fa")]),
-                ]
-            )
-        )
-        return table
-
-    def generate_treatment_register(
-        self, path: Path, from_date: date, to_date: date
+        """Create a styled table whose header row repeats on every page."""
+        table_class = LongTable if len(data) > _LONG_TABLE_ROWS else Table
+        return table_class(data, colWidths=col_widths, style=_TABLE_STYLE, repeatRows=1)
+
+    def _run_tabular_report(
+        self,
+        path: Path,
+        title: str,
+        subtitle: str,
+        header_row: list[str],
+        rows: Iterable[Sequence],
+        empty_message: str,
+        col_widths: Optional[list[float]] = None,
+        empty_style: Optional[ParagraphStyle] = None,
+        preamble: Iterable = (),
+        epilogue: Iterable = (),
     ) -> None:
-        """Generate treatment register PDF."""
-        doc = SimpleDocTemplate(str(path), pagesize=A4)
-        elements = []
-
-        # Header
-        elements.extend(self._get_property_header())
-        elements.append(Paragraph("Treatment Register", self.styles["ReportTitle"]))
-        elements.append(
-            Paragraph(
-                f"Period: {from_date.strftime('%d/%m/%Y')} to {to_date.strftime('%d/%m/%Y')}",
-                self.styles["ReportSubtitle"],
-            )
-        )
-
-        # Get treatment events
-        events = self.db.get_recent_events(limit=1000)
-        treatment_events = [
-            e
-            for e in events
-            if e.event_type == EventType.TREATMENT
-            and from_date <= e.event_date <= to_date
-        ]
-
-        if not treatment_events:
-            elements.append(Paragraph("No treatments recorded in this period.", self.styles["Normal"]))
+        """Build and write a report whose body is one table.
+
+        The preamble flowables go between the subtitle and the table. The
+        epilogue follows the table and, like it, is left out when there are no
+        rows, in which case empty_message is shown instead.
+        """
+        doc = _ReportDocument(path)
+
+        elements = self._get_property_header()
+        elements.append(Paragraph(title, self.styles["ReportTitle"]))
+        elements.append(Paragraph(subtitle, self.styles["ReportSubtitle"]))
+        elements.extend(preamble)
+
+        data = [header_row]
+        data.extend(rows)
+        if len(data) > 1:
+            elements.append(self._create_table(data, col_widths))
+            elements.extend(epilogue)
         else:
-            # Build table data
-            data = [["Date", "Animal/Mob", "Product", "Dose", "Batch", "WHP End", "By"]]
-
-            products = {p.id: p.name for p in self.db.get_all_products()}
+            elements.append(Paragraph(empty_message, empty_style or self.styles["Normal"]))
 
-            for event in treatment_events:
-                treatment = self.db.get_treatment_details(event.id)
-                if not treatment:
-                    continue
-
-                # Get identifier
-                identifier = ""
-                if event.animal_id:
-                    animal = self.db.get_animal(event.animal_id)
-                    if animal:
-                        identifier = animal.display_id
-                elif event.mob_id:
-                    mob = self.db.get_mob(event.mob_id)
-                    if mob:
-                        identifier = f"Mob: {mob.name}"
-
-                whp_end = ""
-                if treatment.meat_whp_end:
-                    whp_end = treatment.meat_whp_end.strftime("%d/%m/%Y")
+        doc.build(elements)
 
-                data.append([
-                    event.event_date.strftime("%d/%m/%Y"),
-                    identifier,
-                    products.get(treatment.product_id, "Unknown"),
-                    treatment.dose,
-                    treatment.batch_number,
-                    whp_end,
-                    treatment.administered_by,
-                ])
+    def _run_tabular_canvas(
+        self,
+        path: Path,
+        title: str,
+        subtitle: str,
+        header_row: list[str],
+        rows: Sequence[Sequence[str]],
+        empty_message: str,
+        col_widths: list[float],
+    ) -> None:
+        """Write a one-table report by drawing straight onto the canvas.
+
+        A faster alternative to _run_tabular_report for fixed-width tables of
+        strings: no flowables are measured or split. Text too long for its
+        column wraps onto extra lines and the row grows to fit, so every value
+        is printed in full.
+        """
+        canvas = Canvas(str(path), pagesize=A4)
+        page_width, page_height = A4
+        footer_text = f"Generated: {date.today().strftime('%d/%m/%Y')}"
+
+        def finish_page() -> None:
+            canvas.setFont("Helvetica", 9)
+            canvas.setFillColor(colors.black)
+            canvas.drawString(inch, inch / 2, footer_text)
+            canvas.showPage()
+
+        y = page_height - inch
+        header = self._get_property_header()
+        for paragraph in header:
+            style = paragraph.style
+            y -= style.leading
+            canvas.setFont(style.fontName, style.fontSize)
+            canvas.drawString(inch, y, paragraph.getPlainText())
+        if header:
+            y -= 10
+        y -= 22
+        canvas.setFont("Helvetica-Bold", 18)
+        canvas.drawString(inch, y, title)
+        y -= 22
+        canvas.setFont("Helvetica", 10)
+        canvas.drawString(inch, y, subtitle)
+        y -= 20
+
+        if not rows:
+            canvas.drawString(inch, y - 12, empty_message)
+            finish_page()
+            canvas.save()
+            return
+
+        # Centred like a platypus Table
+        x = (page_width - sum(col_widths)) / 2
+        col_x_positions = []
+        for width in col_widths:
+            col_x_positions.append(x)
+            x += width
+
+        text_widths = [width - 2 * _CANVAS_CELL_PADDING for width in col_widths]
+
+        def wrap_row(row: Sequence, font_name: str) -> tuple[list[list[str]], float]:
+            cells = [
+                _wrap_text(str(value), width, font_name, _CANVAS_FONT_SIZE)
+                for value, width in zip(row, text_widths)
+            ]
+            lines = max(len(cell) for cell in cells)
+            return cells, _CANVAS_ROW_HEIGHT + (lines - 1) * _CANVAS_LEADING
+
+        header_cells, header_height = wrap_row(header_row, "Helvetica-Bold")
+        wrapped = [wrap_row(row, "Helvetica") for row in rows]
+
+        start = 0
+        while start < len(wrapped):
+            # The header is repeated at the top of every page, and each page
+            # takes at least one row so an oversized row cannot stall the loop
+            space = y - inch - header_height
+            end = start + 1
+            space -= wrapped[start][1]
+            while end < len(wrapped) and wrapped[end][1] <= space:
+                space -= wrapped[end][1]
+                end += 1
+            page = wrapped[start:end]
+            _draw_tabular_canvas(
+                canvas,
+                [header_cells, *(cells for cells, _ in page)],
+                [header_height, *(height for _, height in page)],
+                col_x_positions,
+                col_widths,
+                y,
+                _CANVAS_FONT_SIZE,
+            )
+            finish_page()
+            start = end
+            y = page_height - inch
 
-            table = self._create_table(data, col_widths=[55, 80, 80, 60, 60, 70, 60])
-            elements.append(table)
+        canvas.save()
 
-        # Footer
-        elements.append(Spacer(1, 20))
-        elements.append(
-            Paragraph(
-                f"Generated: {date.today().strftime('%d/%m/%Y')}",
-                self.styles["Normal"],
+    def generate_treatment_register(
+        self, path: Path, from_date: date, to_date: date, use_fast: bool = True
+    ) -> None:
+        """Generate treatment register PDF.
+
+        With use_fast the table is drawn directly onto the canvas; pass False
+        to lay it out with platypus instead.
+        """
+        with self.db.read_transaction():
+            # One joined query returns every row already formatted for the table
+            rows = self.db.get_treatment_register_rows(from_date, to_date)
+
+            run_report = self._run_tabular_canvas if use_fast else self._run_tabular_report
+            run_report(
+                path,
+                "Treatment Register",
+                f"Period: {from_date.strftime('%d/%m/%Y')} to {to_date.strftime('%d/%m/%Y')}",
+                ["Date", "Animal/Mob", "Product", "Dose", "Batch", "WHP End", "By"],
+                rows,
+                "No treatments recorded in this period.",
+                col_widths=[55, 80, 80, 60, 60, 70, 60],
             )
-        )
-
-        doc.build(elements)
 
     def generate_movement_log(
         self, path: Path, from_date: date, to_date: date
     ) -> None:
         """Generate movement log PDF."""
-        doc = SimpleDocTemplate(str(path), pagesize=A4)
-        elements = []
-
-        # Header
-        elements.extend(self._get_property_header())
-        elements.append(Paragraph("Movement Log", self.styles["ReportTitle"]))
-        elements.append(
-            Paragraph(
-                f"Period: {from_date.strftime('%d/%m/%Y')} to {to_date.strftime('%d/%m/%Y')}",
-                self.styles["ReportSubtitle"],
-            )
-        )
-
-        # Get movement events
-        events = self.db.get_recent_events(limit=1000)
-        movement_events = [
-            e
-            for e in events
-            if e.event_type == EventType.MOVEMENT
-            and from_date <= e.event_date <= to_date
-        ]
-
-        if not movement_events:
-            elements.append(Paragraph("No movements recorded in this period.", self.styles["Normal"]))
-        else:
-            data = [["Date", "Animal/Mob", "From", "To", "Reason", "Head Count"]]
-
-            paddocks = {p.id: p.name for p in self.db.get_all_paddocks()}
+        with self.db.read_transaction():
+            # One joined query returns every row already formatted for the table
+            rows = self.db.get_movement_log_rows(from_date, to_date)
 
-            for event in movement_events:
-                movement = self.db.get_movement_details(event.id)
-                if not movement:
-                    continue
-
-                identifier = ""
-                if event.animal_id:
-                    animal = self.db.get_animal(event.animal_id)
-                    if animal:
-                        identifier = animal.display_id
-                elif event.mob_id:
-                    mob = self.db.get_mob(event.mob_id)
-                    if mob:
-                        identifier = mob.name
-
-                from_paddock = paddocks.get(movement.from_paddock_id, "-")
-                to_paddock = paddocks.get(movement.to_paddock_id, "-")
-
-                data.append([
-                    event.event_date.strftime("%d/%m/%Y"),
-                    identifier,
-                    from_paddock,
-                    to_paddock,
-                    movement.reason or "-",
-                    str(movement.head_count) if movement.head_count else "-",
-                ])
-
-            table = self._create_table(data)
-            elements.append(table)
-
-        elements.append(Spacer(1, 20))
-        elements.append(
-            Paragraph(
-                f"Generated: {date.today().strftime('%d/%m/%Y')}",
-                self.styles["Normal"],
+            self._run_tabular_report(
+                path,
+                "Movement Log",
+                f"Period: {from_date.strftime('%d/%m/%Y')} to {to_date.strftime('%d/%m/%Y')}",
+                ["Date", "Animal/Mob", "From", "To", "Reason", "Head Count"],
+                rows,
+                "No movements recorded in this period.",
             )
-        )
-
-        doc.build(elements)
 
     def generate_whp_clearance(self, path: Path) -> None:
         """Generate WHP clearance list PDF."""
-        doc = SimpleDocTemplate(str(path), pagesize=A4)
-        elements = []
-
-        # Header
-        elements.extend(self._get_property_header())
-        elements.append(Paragraph("WHP Clearance List", self.styles["ReportTitle"]))
-        elements.append(
-            Paragraph(
-                f"As of: {date.today().strftime('%d/%m/%Y')}",
-                self.styles["ReportSubtitle"],
-            )
-        )
-
-        # Warning
-        elements.append(
-            Paragraph(
-                "IMPORTANT: Animals listed below are currently under withholding period "
-                "and must NOT be sold for slaughter until their clearance date.",
-                ParagraphStyle(
-                    name="Warning",
-                    parent=self.styles["Normal"],
-                    textColor=colors.red,
-                    fontSize=10,
-                    spaceAfter=15,
-                ),
-            )
-        )
-
-        whp_animals = self.db.get_animals_on_whp()
-
-        if not whp_animals:
-            elements.append(
-                Paragraph(
-                    "No animals currently under withholding period. All clear for sale.",
-                    ParagraphStyle(
-                        name="Success",
-                        parent=self.styles["Normal"],
-                        textColor=colors.green,
-                        fontSize=12,
-                    ),
-                )
-            )
-        else:
-            data = [["Tag", "EID", "Product", "Treatment Date", "Meat WHP End", "Days Left"]]
-
+        with self.db.read_transaction():
+            whp_animals = self.db.get_animals_on_whp()
             today = date.today()
 
-            for item in whp_animals:
-                days_left = ""
-                if item["meat_whp_end"]:
-                    days_left = str((item["meat_whp_end"] - today).days)
-
-                data.append([
+            data = [
+                [
                     item["visual_tag"] or "-",
                     item["eid"] or "-",
                     item["product_name"] or "Unknown",
                     str(item["event_date"]) if item["event_date"] else "-",
                     item["meat_whp_end"].strftime("%d/%m/%Y") if item["meat_whp_end"] else "-",
-                    days_left,
-                ])
-
-            table = self._create_table(data)
-            elements.append(table)
+                    str(item["days_left"]) if item["meat_whp_end"] else "",
+                ]
+                for item in whp_animals
+            ]
 
-        elements.append(Spacer(1, 20))
-        elements.append(
-            Paragraph(
-                f"Generated: {date.today().strftime('%d/%m/%Y')}",
-                self.styles["Normal"],
+            self._run_tabular_report(
+                path,
+                "WHP Clearance List",
+                f"As of: {today.strftime('%d/%m/%Y')}",
+                ["Tag", "EID", "Product", "Treatment Date", "Meat WHP End", "Days Left"],
+                data,
+                "No animals currently under withholding period. All clear for sale.",
+                empty_style=_SUCCESS_STYLE,
+                preamble=[
+                    Paragraph(
+                        "IMPORTANT: Animals listed below are currently under withholding period "
+                        "and must NOT be sold for slaughter until their clearance date.",
+                        _WARNING_STYLE,
+                    )
+                ],
             )
-        )
-
-        doc.build(elements)
 
     def generate_sale_draft(self, path: Path) -> None:
         """Generate sale draft sheet PDF."""
-        doc = SimpleDocTemplate(str(path), pagesize=A4)
-        elements = []
-
-        # Header
-        elements.extend(self._get_property_header())
-        elements.append(Paragraph("Sale Draft Sheet", self.styles["ReportTitle"]))
-        elements.append(
-            Paragraph(
-                f"Prepared: {date.today().strftime('%d/%m/%Y')}",
-                self.styles["ReportSubtitle"],
-            )
-        )
-
-        # Get alive animals not on WHP
-        whp_animal_ids = {item["animal_id"] for item in self.db.get_animals_on_whp()}
-        all_animals = self.db.get_all_animals(status=AnimalStatus.ALIVE)
-        sale_ready = [a for a in all_animals if a.id not in whp_animal_ids]
-
-        if not sale_ready:
-            elements.append(
-                Paragraph("No animals available for sale (all on WHP or none alive).", self.styles["Normal"])
-            )
-        else:
-            # Group by mob
-            mobs = {m.id: m.name for m in self.db.get_all_mobs()}
-
-            data = [["Tag", "EID", "Species", "Breed", "Sex", "Mob", "Notes"]]
-
-            for animal in sale_ready:
-                data.append([
-                    animal.visual_tag or "-",
-                    animal.eid or "-",
-                    animal.species.value.title(),
-                    animal.breed or "-",
-                    animal.sex.value.title(),
-                    mobs.get(animal.mob_id, "-"),
-                    "",  # Empty notes column for handwriting
-                ])
-
-            table = self._create_table(data, col_widths=[50, 70, 50, 60, 50, 70, 100])
-            elements.append(table)
+        with self.db.read_transaction():
+            # Get alive animals not on WHP
+            sale_ready = self.db.get_sale_ready_animals()
 
-            elements.append(Spacer(1, 15))
-            elements.append(
-                Paragraph(f"Total animals ready for sale: {len(sale_ready)}", self.styles["Heading3"])
-            )
+            mobs = self._get_mob_names()
 
-        elements.append(Spacer(1, 20))
-        elements.append(
-            Paragraph(
-                f"Generated: {date.today().strftime('%d/%m/%Y')}",
-                self.styles["Normal"],
+            self._run_tabular_report(
+                path,
+                "Sale Draft Sheet",
+                f"Prepared: {date.today().strftime('%d/%m/%Y')}",
+                ["Tag", "EID", "Species", "Breed", "Sex", "Mob", "Notes"],
+                (
+                    [
+                        animal.visual_tag or "-",
+                        animal.eid or "-",
+                        _SPECIES_LABEL[animal.species],
+                        animal.breed or "-",
+                        _SEX_LABEL[animal.sex],
+                        mobs.get(animal.mob_id, "-"),
+                        "",  # Empty notes column for handwriting
+                    ]
+                    for animal in sale_ready
+                ),
+                "No animals available for sale (all on WHP or none alive).",
+                col_widths=[50, 70, 50, 60, 50, 70, 100],
+                epilogue=[
+                    Spacer(1, 15),
+                    Paragraph(
+                        f"Total animals ready for sale: {len(sale_ready)}", self.styles["Heading3"]
+                    ),
+                ],
             )
-        )
-
-        doc.build(elements)
 
     def generate_inventory(self, path: Path) -> None:
         """Generate animal inventory PDF."""
-        doc = SimpleDocTemplate(str(path), pagesize=A4)
-        elements = []
-
-        # Header
-        elements.extend(self._get_property_header())
-        elements.append(Paragraph("Animal Inventory", self.styles["ReportTitle"]))
-        elements.append(
-            Paragraph(
+        with self.db.read_transaction():
+            # Summary counts
+            counts = self.db.get_animal_counts()
+            species_counts = self.db.get_species_counts()
+
+            summary_data = [["Status", "Count"]]
+            for status, count in counts.items():
+                summary_data.append([status.title(), str(count)])
+            summary_data.append(["Total", str(sum(counts.values()))])
+
+            # Alive animals by species
+            species_data = [["Species", "Count"]]
+            for species, count in species_counts.items():
+                species_data.append([species.title(), str(count)])
+
+            # Full animal list
+            all_animals = self.db.get_all_animals()
+            mobs = self._get_mob_names()
+
+            self._run_tabular_report(
+                path,
+                "Animal Inventory",
                 f"As of: {date.today().strftime('%d/%m/%Y')}",
-                self.styles["ReportSubtitle"],
-            )
-        )
-
-        # Summary counts
-        counts = self.db.get_animal_counts()
-        species_counts = self.db.get_species_counts()
-
-        elements.append(Paragraph("Summary", self.styles["Heading2"]))
-
-        summary_data = [["Status", "Count"]]
-        for status, count in counts.items():
-            summary_data.append([status.title(), str(count)])
-        summary_data.append(["Total", str(sum(counts.values()))])
-
-        summary_table = self._create_table(summary_data, col_widths=[150, 100])
-        elements.append(summary_table)
-        elements.append(Spacer(1, 15))
-
-        # Alive animals by species
-        elements.append(Paragraph("Alive by Species", self.styles["Heading3"]))
-        species_data = [["Species", "Count"]]
-        for species, count in species_counts.items():
-            species_data.append([species.title(), str(count)])
-
-        species_table = self._create_table(species_data, col_widths=[150, 100])
-        elements.append(species_table)
-        elements.append(Spacer(1, 20))
-
-        # Full animal list
-        elements.append(Paragraph("Complete Animal List", self.styles["Heading2"]))
-
-        all_animals = self.db.get_all_animals()
-        mobs = {m.id: m.name for m in self.db.get_all_mobs()}
-
-        if all_animals:
-            data = [["Tag", "EID", "Species", "Breed", "Sex", "Status", "Mob"]]
-
-            for animal in all_animals:
-                data.append([
-                    animal.visual_tag or "-",
-                    animal.eid or "-",
-                    animal.species.value.title(),
-                    animal.breed or "-",
-                    animal.sex.value.title(),
-                    animal.status.value.title(),
-                    mobs.get(animal.mob_id, "-"),
-                ])
-
-            table = self._create_table(data)
-            elements.append(table)
-        else:
-            elements.append(Paragraph("No animals in database.", self.styles["Normal"]))
-
-        elements.append(Spacer(1, 20))
-        elements.append(
-            Paragraph(
-                f"Generated: {date.today().strftime('%d/%m/%Y')}",
-                self.styles["Normal"],
+                ["Tag", "EID", "Species", "Breed", "Sex", "Status", "Mob"],
+                (
+                    [
+                        animal.visual_tag or "-",
+                        animal.eid or "-",
+                        _SPECIES_LABEL[animal.species],
+                        animal.breed or "-",
+                        _SEX_LABEL[animal.sex],
+                        _STATUS_LABEL[animal.status],
+                        mobs.get(animal.mob_id, "-"),
+                    ]
+                    for animal in all_animals
+                ),
+                "No animals in database.",
+                preamble=[
+                    Paragraph("Summary", self.styles["Heading2"]),
+                    self._create_table(summary_data, col_widths=[150, 100]),
+                    Spacer(1, 15),
+                    Paragraph("Alive by Species", self.styles["Heading3"]),
+                    self._create_table(species_data, col_widths=[150, 100]),
+                    Spacer(1, 20),
+                    Paragraph("Complete Animal List", self.styles["Heading2"]),
+                ],
             )
-        )
-
-        doc.build(elements)
 
     def generate_weight_summary(
         self, path: Path, from_date: date, to_date: date
     ) -> None:
         """Generate weight summary PDF."""
-        doc = SimpleDocTemplate(str(path), pagesize=A4)
-        elements = []
-
-        # Header
-        elements.extend(self._get_property_header())
-        elements.append(Paragraph("Weight Summary", self.styles["ReportTitle"]))
-        elements.append(
-            Paragraph(
-                f"Period: {from_date.strftime('%d/%m/%Y')} to {to_date.strftime('%d/%m/%Y')}",
-                self.styles["ReportSubtitle"],
+        with self.db.read_transaction():
+            weight_events = self.db.get_events_by_type_in_range(
+                EventType.WEIGH, from_date, to_date
+            )
+            weighs = self.db.get_weigh_details_by_event_ids(e.id for e in weight_events)
+            animals = self.db.get_animals_by_ids(
+                {e.animal_id for e in weight_events if e.animal_id}
             )
-        )
-
-        # Get weight events
-        events = self.db.get_recent_events(limit=1000)
-        weight_events = [
-            e
-            for e in events
-            if e.event_type == EventType.WEIGH
-            and from_date <= e.event_date <= to_date
-        ]
-
-        if not weight_events:
-            elements.append(Paragraph("No weights recorded in this period.", self.styles["Normal"]))
-        else:
-            data = [["Date", "Animal", "Weight (kg)", "Condition Score"]]
 
+            data = []
             for event in weight_events:
-                weigh = self.db.get_weigh_details(event.id)
+                weigh = weighs.get(event.id)
                 if not weigh:
                     continue
 
                 identifier = ""
                 if event.animal_id:
-                    animal = self.db.get_animal(event.animal_id)
+                    animal = animals.get(event.animal_id)
                     if animal:
                         identifier = animal.display_id
 
@@ -498,18 +565,10 @@ class ReportGenerator:
                     cs,
                 ])
 
-            table = self._create_table(data)
-            elements.append(table)
-
             # Summary stats
-            elements.append(Spacer(1, 15))
-            elements.append(Paragraph("Statistics", self.styles["Heading3"]))
+            statistics = [Spacer(1, 15), Paragraph("Statistics", self.styles["Heading3"])]
 
-            weights = [
-                self.db.get_weigh_details(e.id).weight_kg
-                for e in weight_events
-                if self.db.get_weigh_details(e.id)
-            ]
+            weights = [weigh.weight_kg for weigh in weighs.values()]
 
             if weights:
                 avg_weight = sum(weights) / len(weights)
@@ -522,14 +581,14 @@ class ReportGenerator:
                     f"Minimum weight: {min_weight:.1f} kg<br/>"
                     f"Maximum weight: {max_weight:.1f} kg"
                 )
-                elements.append(Paragraph(stats_text, self.styles["Normal"]))
+                statistics.append(Paragraph(stats_text, self.styles["Normal"]))
 
-        elements.append(Spacer(1, 20))
-        elements.append(
-            Paragraph(
-                f"Generated: {date.today().strftime('%d/%m/%Y')}",
-                self.styles["Normal"],
+            self._run_tabular_report(
+                path,
+                "Weight Summary",
+                f"Period: {from_date.strftime('%d/%m/%Y')} to {to_date.strftime('%d/%m/%Y')}",
+                ["Date", "Animal", "Weight (kg)", "Condition Score"],
+                data,
+                "No weights recorded in this period.",
+                epilogue=statistics,
             )
-        )
-
-        doc.build(elements)
@@ -1,6 +1,7 @@
 """Dialog for adding/editing animals."""
 
 from datetime import date
+from enum import Enum
 from typing import Optional
 
 from PySide6.QtWidgets import (
@@ -17,12 +18,58 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QGroupBox,
 )
-from PySide6.QtCore import QDate
+from PySide6.QtCore import QDate, Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 from stockbook.models.database import Database
 from stockbook.models.entities import Animal, AnimalStatus, AnimalSex, Species
 
 
+# Fixed choices for the enum combos, as (label, value) pairs
+_SPECIES_CHOICES = (
+    ("Cattle", Species.CATTLE),
+    ("Sheep", Species.SHEEP),
+)
+_SEX_CHOICES = (
+    ("Female", AnimalSex.FEMALE),
+    ("Male", AnimalSex.MALE),
+    ("Steer (castrated male cattle)", AnimalSex.STEER),
+    ("Wether (castrated male sheep)", AnimalSex.WETHER),
+)
+_STATUS_CHOICES = (
+    ("Alive", AnimalStatus.ALIVE),
+    ("Sold", AnimalStatus.SOLD),
+    ("Dead", AnimalStatus.DEAD),
+    ("Missing", AnimalStatus.MISSING),
+)
+
+# Combo index of each value, so _populate_fields need not scan with findData
+_SPECIES_INDEX = {value: i for i, (_, value) in enumerate(_SPECIES_CHOICES)}
+_SEX_INDEX = {value: i for i, (_, value) in enumerate(_SEX_CHOICES)}
+_STATUS_INDEX = {value: i for i, (_, value) in enumerate(_STATUS_CHOICES)}
+
+# Item models for the choices above, keyed by the choices tuple. Each is
+# built the first time a dialog opens (Qt models need the QApplication, so
+# not at import) and shared by every later dialog; a combo only reads its
+# model, and keeps its own current index.
+_choice_models: dict[tuple[tuple[str, Enum], ...], QStandardItemModel] = {}
+
+
+def _choice_model(choices: tuple[tuple[str, Enum], ...]) -> QStandardItemModel:
+    """Get the shared item model for a fixed set of choices."""
+    model = _choice_models.get(choices)
+    if model is None:
+        items = []
+        for label, value in choices:
+            item = QStandardItem(label)
+            item.setData(value, Qt.ItemDataRole.UserRole)
+            items.append(item)
+        model = QStandardItemModel()
+        model.appendColumn(items)
+        _choice_models[choices] = model
+    return model
+
+
 class AnimalDialog(QDialog):
     """Dialog for adding or editing an animal."""
 
@@ -65,8 +112,7 @@ class AnimalDialog(QDialog):
         details_layout = QFormLayout(details_group)
 
         self.species_combo = QComboBox()
-        self.species_combo.addItem("Cattle", Species.CATTLE)
-        self.species_combo.addItem("Sheep", Species.SHEEP)
+        self.species_combo.setModel(_choice_model(_SPECIES_CHOICES))
         details_layout.addRow("Species:", self.species_combo)
 
         self.breed_edit = QLineEdit()
@@ -74,10 +120,7 @@ class AnimalDialog(QDialog):
         details_layout.addRow("Breed:", self.breed_edit)
 
         self.sex_combo = QComboBox()
-        self.sex_combo.addItem("Female", AnimalSex.FEMALE)
-        self.sex_combo.addItem("Male", AnimalSex.MALE)
-        self.sex_combo.addItem("Steer (castrated male cattle)", AnimalSex.STEER)
-        self.sex_combo.addItem("Wether (castrated male sheep)", AnimalSex.WETHER)
+        self.sex_combo.setModel(_choice_model(_SEX_CHOICES))
         details_layout.addRow("Sex:", self.sex_combo)
 
         self.dob_edit = QDateEdit()
@@ -87,10 +130,7 @@ class AnimalDialog(QDialog):
         details_layout.addRow("Date of Birth:", self.dob_edit)
 
         self.status_combo = QComboBox()
-        self.status_combo.addItem("Alive", AnimalStatus.ALIVE)
-        self.status_combo.addItem("Sold", AnimalStatus.SOLD)
-        self.status_combo.addItem("Dead", AnimalStatus.DEAD)
-        self.status_combo.addItem("Missing", AnimalStatus.MISSING)
+        self.status_combo.setModel(_choice_model(_STATUS_CHOICES))
         details_layout.addRow("Status:", self.status_combo)
 
         layout.addWidget(details_group)
@@ -99,10 +139,20 @@ class AnimalDialog(QDialog):
         mob_group = QGroupBox("Mob Assignment")
         mob_layout = QFormLayout(mob_group)
 
+        # Fill a model in one call and hand it to the combo, rather than
+        # inserting mobs into the combo one addItem at a time
+        mob_items = [QStandardItem("(No Mob)")]
+        self._mob_index: dict[int, int] = {}
+        for mob in self.db.mob_cache:
+            item = QStandardItem(mob.name)
+            item.setData(mob.id, Qt.ItemDataRole.UserRole)
+            self._mob_index[mob.id] = len(mob_items)
+            mob_items.append(item)
+
         self.mob_combo = QComboBox()
-        self.mob_combo.addItem("(No Mob)", None)
-        for mob in self.db.get_all_mobs():
-            self.mob_combo.addItem(mob.name, mob.id)
+        mob_model = QStandardItemModel(self.mob_combo)
+        mob_model.appendColumn(mob_items)
+        self.mob_combo.setModel(mob_model)
         mob_layout.addRow("Mob:", self.mob_combo)
 
         layout.addWidget(mob_group)
@@ -135,22 +185,13 @@ class AnimalDialog(QDialog):
             self.notes_edit.setPlainText(self.animal.notes)
 
             # Set combo box selections
-            index = self.species_combo.findData(self.animal.species)
-            if index >= 0:
-                self.species_combo.setCurrentIndex(index)
-
-            index = self.sex_combo.findData(self.animal.sex)
-            if index >= 0:
-                self.sex_combo.setCurrentIndex(index)
-
-            index = self.status_combo.findData(self.animal.status)
-            if index >= 0:
-                self.status_combo.setCurrentIndex(index)
-
-            if self.animal.mob_id:
-                index = self.mob_combo.findData(self.animal.mob_id)
-                if index >= 0:
-                    self.mob_combo.setCurrentIndex(index)
+            self.species_combo.setCurrentIndex(_SPECIES_INDEX[self.animal.species])
+            self.sex_combo.setCurrentIndex(_SEX_INDEX[self.animal.sex])
+            self.status_combo.setCurrentIndex(_STATUS_INDEX[self.animal.status])
+
+            index = self._mob_index.get(self.animal.mob_id)
+            if index is not None:
+                self.mob_combo.setCurrentIndex(index)
 
             if self.animal.date_of_birth:
                 qdate = QDate(
@@ -1,9 +1,11 @@
 """Quick action dialogs for common operations."""
 
-from datetime import date, timedelta
-from typing import Optional
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Optional, Sequence
 
 from PySide6.QtWidgets import (
+    QCompleter,
     QDialog,
     QVBoxLayout,
     QFormLayout,
@@ -17,7 +19,8 @@ from PySide6.QtWidgets import (
     QLabel,
     QGroupBox,
 )
-from PySide6.QtCore import QDate
+from PySide6.QtCore import QDate, QObject, QRunnable, QThreadPool, Qt, Signal
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 from stockbook.models.database import Database
 from stockbook.models.entities import (
@@ -25,19 +28,158 @@ from stockbook.models.entities import (
     AnimalStatus,
     Event,
     MovementEvent,
+    Product,
     TreatmentEvent,
     WeighEvent,
     TreatmentRoute,
 )
 
 
-class QuickMoveDialog(QDialog):
-    """Dialog for quickly moving animals to a different mob."""
+# Pick lists longer than this become editable, with a completer that matches
+# anywhere in the name, so a long list can be narrowed by typing
+_COMPLETER_THRESHOLD = 200
+
+# (label, route) pairs for the treatment route combo
+_ROUTE_ITEMS = tuple((route.value.replace("_", " ").title(), route) for route in TreatmentRoute)
+
+
+def _set_combo_items(combo: QComboBox, entries: Sequence[tuple[str, object]]) -> None:
+    """Fill a combo from (label, data) pairs in one step.
+
+    The items go into a QStandardItemModel that is complete before it is set
+    on the combo, so the combo is not updated once per item as with addItem.
+    Long lists become editable with a completer; choosing a completion selects
+    that item, and _combo_text_matches() catches text that was typed but
+    never matched to one.
+    """
+    items = []
+    for label, data in entries:
+        item = QStandardItem(label)
+        item.setData(data, Qt.ItemDataRole.UserRole)
+        items.append(item)
+
+    model = QStandardItemModel(combo)
+    model.appendColumn(items)
+    combo.setModel(model)
+
+    if len(entries) > _COMPLETER_THRESHOLD:
+        combo.setEditable(True)
+        combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        completer = QCompleter(model, combo)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        completer.activated[str].connect(
+            lambda text: combo.setCurrentIndex(
+                combo.findText(text, Qt.MatchFlag.MatchFixedString)
+            )
+        )
+        combo.setCompleter(completer)
+
+
+def _combo_text_matches(combo: QComboBox) -> bool:
+    """Whether an editable combo shows the item that currentData() returns.
+
+    Typed text that is not an exact item leaves the previous item current,
+    so saving then would use an item the user can no longer see.
+    """
+    if not combo.isEditable():
+        return True
+    return combo.currentText() == combo.itemText(combo.currentIndex())
+
+
+class _DbWriteSignals(QObject):
+    """Signals for _DbWriteTask, which as a QRunnable cannot define its own."""
+
+    finished = Signal(bool, str)  # Succeeded, error text
+
+
+class _DbWriteTask(QRunnable):
+    """Runs one write against the database on a pool thread.
+
+    The write gets a connection of its own, opened and closed on the pool
+    thread, so the UI thread's connection is never used from two threads.
+    """
+
+    def __init__(self, db_path: Path, write: Callable[[Database], object]):
+        super().__init__()
+        self.db_path = db_path
+        self.write = write
+        self.signals = _DbWriteSignals()
+
+    def run(self) -> None:
+        db = Database(self.db_path)
+        try:
+            db.connect()
+            self.write(db)
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+        else:
+            self.signals.finished.emit(True, "")
+        finally:
+            db.close()
+
+
+class _QuickActionDialog(QDialog):
+    """Base for the quick action dialogs, which save on a pool thread."""
 
     def __init__(self, db: Database, animal_ids: list[int], parent=None):
         super().__init__(parent)
         self.db = db
         self.animal_ids = animal_ids
+        self._write_task: Optional[_DbWriteTask] = None
+
+    def _add_info_label(self, layout: QVBoxLayout, text: str) -> None:
+        """Add the bold line at the top of the dialog saying what it will do."""
+        info = QLabel(text)
+        info.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
+        layout.addWidget(info)
+
+    def _add_buttons(
+        self,
+        layout: QVBoxLayout,
+        accept_button: QDialogButtonBox.StandardButton,
+        on_accept: Callable[[], None],
+    ) -> None:
+        """Add the accept/Cancel button box, wired to on_accept and reject.
+
+        on_accept validates the form and saves it with _run_write.
+        """
+        self.buttons = QDialogButtonBox(accept_button | QDialogButtonBox.StandardButton.Cancel)
+        self.buttons.accepted.connect(on_accept)
+        self.buttons.rejected.connect(self.reject)
+        layout.addWidget(self.buttons)
+
+    def _run_write(self, write: Callable[[Database], object]) -> None:
+        """Run write on a pool thread and accept the dialog once it commits.
+
+        The buttons are disabled until it finishes. If it fails, the error
+        is shown and the dialog stays open.
+        """
+        self.buttons.setEnabled(False)
+        self._write_task = _DbWriteTask(self.db.db_path, write)
+        self._write_task.signals.finished.connect(self._on_write_finished)
+        QThreadPool.globalInstance().start(self._write_task)
+
+    def _on_write_finished(self, ok: bool, error: str) -> None:
+        self._write_task = None
+        if ok:
+            self.accept()
+        else:
+            self.buttons.setEnabled(True)
+            QMessageBox.critical(self, "Error", f"Failed to save: {error}")
+
+    def reject(self) -> None:
+        """Close without saving, unless a save is already under way."""
+        if self._write_task is None:
+            super().reject()
+
+
+class QuickMoveDialog(_QuickActionDialog):
+    """Dialog for quickly moving animals to a different mob."""
+
+    def __init__(self, db: Database, animal_ids: list[int], parent=None):
+        super().__init__(db, animal_ids, parent)
 
         self.setWindowTitle("Move Animals to Mob")
         self.setMinimumWidth(400)
@@ -47,47 +189,38 @@ class QuickMoveDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Info label
-        info = QLabel(f"Moving {len(self.animal_ids)} animal(s) to a new mob")
-        info.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
-        layout.addWidget(info)
+        self._add_info_label(layout, f"Moving {len(self.animal_ids)} animal(s) to a new mob")
 
         form = QFormLayout()
 
         self.mob_combo = QComboBox()
-        self.mob_combo.addItem("(Remove from mob)", None)
-        for mob in self.db.get_all_mobs():
-            self.mob_combo.addItem(mob.name, mob.id)
+        _set_combo_items(
+            self.mob_combo,
+            [("(Remove from mob)", None)] + [(mob.name, mob.id) for mob in self.db.mob_cache],
+        )
         form.addRow("Target Mob:", self.mob_combo)
 
         layout.addLayout(form)
 
         # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        buttons.accepted.connect(self._on_accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        self._add_buttons(layout, QDialogButtonBox.StandardButton.Ok, self._on_accept)
 
     def _on_accept(self) -> None:
-        mob_id = self.mob_combo.currentData()
-
-        for animal_id in self.animal_ids:
-            animal = self.db.get_animal(animal_id)
-            if animal:
-                animal.mob_id = mob_id
-                self.db.save_animal(animal)
+        if not _combo_text_matches(self.mob_combo):
+            QMessageBox.warning(self, "Validation Error", "Please choose a mob from the list.")
+            return
 
-        self.accept()
+        mob_id = self.mob_combo.currentData()
+        self._run_write(lambda db: db.bulk_set_mob(self.animal_ids, mob_id))
 
 
-class QuickTreatmentDialog(QDialog):
+class QuickTreatmentDialog(_QuickActionDialog):
     """Dialog for quickly recording treatments."""
 
     def __init__(self, db: Database, animal_ids: list[int], parent=None):
-        super().__init__(parent)
-        self.db = db
-        self.animal_ids = animal_ids
+        super().__init__(db, animal_ids, parent)
+        # Product chosen in the combo, loaded once by _on_product_changed
+        self._selected_product: Optional[Product] = None
 
         self.setWindowTitle("Record Treatment")
         self.setMinimumWidth(500)
@@ -97,18 +230,21 @@ class QuickTreatmentDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Info label
-        info = QLabel(f"Recording treatment for {len(self.animal_ids)} animal(s)")
-        info.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
-        layout.addWidget(info)
+        self._add_info_label(layout, f"Recording treatment for {len(self.animal_ids)} animal(s)")
 
         # Treatment details
         group = QGroupBox("Treatment Details")
         form = QFormLayout(group)
 
         self.product_combo = QComboBox()
-        self.product_combo.addItem("(Select product)", None)
-        for product in self.db.get_all_products():
-            self.product_combo.addItem(f"{product.name} ({product.category})", product.id)
+        _set_combo_items(
+            self.product_combo,
+            [("(Select product)", None)]
+            + [
+                (f"{product.name} ({product.category})", product.id)
+                for product in self.db.product_cache
+            ],
+        )
         self.product_combo.currentIndexChanged.connect(self._on_product_changed)
         form.addRow("Product:", self.product_combo)
 
@@ -123,8 +259,7 @@ class QuickTreatmentDialog(QDialog):
         form.addRow("Dose:", self.dose_edit)
 
         self.route_combo = QComboBox()
-        for route in TreatmentRoute:
-            self.route_combo.addItem(route.value.replace("_", " ").title(), route)
+        _set_combo_items(self.route_combo, _ROUTE_ITEMS)
         form.addRow("Route:", self.route_combo)
 
         self.batch_edit = QLineEdit()
@@ -149,17 +284,14 @@ class QuickTreatmentDialog(QDialog):
         layout.addWidget(self.notes_edit)
 
         # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel
-        )
-        buttons.accepted.connect(self._on_accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        self._add_buttons(layout, QDialogButtonBox.StandardButton.Save, self._on_accept)
 
     def _on_product_changed(self) -> None:
         product_id = self.product_combo.currentData()
+        self._selected_product = None
         if product_id:
             product = self.db.get_product(product_id)
+            self._selected_product = product
             if product:
                 self.dose_edit.setText(product.default_dose)
                 index = self.route_combo.findData(product.default_route)
@@ -167,24 +299,27 @@ class QuickTreatmentDialog(QDialog):
                     self.route_combo.setCurrentIndex(index)
 
                 # Show WHP info
-                whp_info = []
-                if product.meat_whp_days > 0:
-                    whp_info.append(f"Meat WHP: {product.meat_whp_days} days")
-                if product.milk_whp_days > 0:
-                    whp_info.append(f"Milk WHP: {product.milk_whp_days} days")
-                if product.esi_days > 0:
-                    whp_info.append(f"ESI: {product.esi_days} days")
-                self.whp_label.setText(" | ".join(whp_info) if whp_info else "No WHP")
+                whp_info = (
+                    f"Meat WHP: {product.meat_whp_days} days" if product.meat_whp_days > 0 else "",
+                    f"Milk WHP: {product.milk_whp_days} days" if product.milk_whp_days > 0 else "",
+                    f"ESI: {product.esi_days} days" if product.esi_days > 0 else "",
+                )
+                self.whp_label.setText(" | ".join(part for part in whp_info if part) or "No WHP")
 
     def _on_accept(self) -> None:
+        if not _combo_text_matches(self.product_combo):
+            QMessageBox.warning(
+                self, "Validation Error", "Please choose a product from the list."
+            )
+            return
+
         product_id = self.product_combo.currentData()
         if not product_id:
             QMessageBox.warning(self, "Validation Error", "Please select a product.")
             return
 
-        product = self.db.get_product(product_id)
-        qdate = self.date_edit.date()
-        event_date = date(qdate.year(), qdate.month(), qdate.day())
+        product = self._selected_product
+        event_date = self.date_edit.date().toPython()
 
         # Calculate WHP end dates
         meat_whp_end = None
@@ -199,38 +334,43 @@ class QuickTreatmentDialog(QDialog):
             if product.esi_days > 0:
                 esi_end = event_date + timedelta(days=product.esi_days)
 
-        # Record treatment for each animal
-        for animal_id in self.animal_ids:
-            event = Event(
-                event_date=event_date,
-                animal_id=animal_id,
-                notes=self.notes_edit.toPlainText().strip(),
-                recorded_by=self.admin_edit.text().strip(),
-            )
-
-            treatment = TreatmentEvent(
-                product_id=product_id,
-                batch_number=self.batch_edit.text().strip(),
-                dose=self.dose_edit.text().strip(),
-                route=self.route_combo.currentData(),
-                administered_by=self.admin_edit.text().strip(),
-                meat_whp_end=meat_whp_end,
-                milk_whp_end=milk_whp_end,
-                esi_end=esi_end,
+        # Read the form once; every animal gets the same values
+        notes = self.notes_edit.toPlainText().strip()
+        administered_by = self.admin_edit.text().strip()
+        batch_number = self.batch_edit.text().strip()
+        dose = self.dose_edit.text().strip()
+        route = self.route_combo.currentData()
+
+        # Record treatment for each animal, all in one transaction
+        events_and_treatments = [
+            (
+                Event(
+                    event_date=event_date,
+                    animal_id=animal_id,
+                    notes=notes,
+                    recorded_by=administered_by,
+                ),
+                TreatmentEvent(
+                    product_id=product_id,
+                    batch_number=batch_number,
+                    dose=dose,
+                    route=route,
+                    administered_by=administered_by,
+                    meat_whp_end=meat_whp_end,
+                    milk_whp_end=milk_whp_end,
+                    esi_end=esi_end,
+                ),
             )
+            for animal_id in self.animal_ids
+        ]
+        self._run_write(lambda db: db.save_treatment_events_bulk(events_and_treatments))
 
-            self.db.save_treatment_event(event, treatment)
-
-        self.accept()
 
-
-class QuickWeighDialog(QDialog):
+class QuickWeighDialog(_QuickActionDialog):
     """Dialog for quickly recording weights."""
 
     def __init__(self, db: Database, animal_ids: list[int], parent=None):
-        super().__init__(parent)
-        self.db = db
-        self.animal_ids = animal_ids
+        super().__init__(db, animal_ids, parent)
 
         self.setWindowTitle("Record Weight")
         self.setMinimumWidth(400)
@@ -247,9 +387,7 @@ class QuickWeighDialog(QDialog):
         else:
             info_text = f"Recording weight for {count} animals (will apply same weight to all)"
 
-        info = QLabel(info_text)
-        info.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
-        layout.addWidget(info)
+        self._add_info_label(layout, info_text)
 
         form = QFormLayout()
 
@@ -274,12 +412,7 @@ class QuickWeighDialog(QDialog):
         layout.addLayout(form)
 
         # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel
-        )
-        buttons.accepted.connect(self._on_accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        self._add_buttons(layout, QDialogButtonBox.StandardButton.Save, self._on_accept)
 
     def _on_accept(self) -> None:
         weight = self.weight_spin.value()
@@ -287,25 +420,24 @@ class QuickWeighDialog(QDialog):
             QMessageBox.warning(self, "Validation Error", "Please enter a valid weight.")
             return
 
-        qdate = self.date_edit.date()
-        event_date = date(qdate.year(), qdate.month(), qdate.day())
+        event_date = self.date_edit.date().toPython()
         condition = self.condition_spin.value() if self.condition_spin.value() > 0 else None
 
-        for animal_id in self.animal_ids:
-            event = Event(event_date=event_date, animal_id=animal_id)
-            weigh = WeighEvent(weight_kg=weight, condition_score=condition)
-            self.db.save_weigh_event(event, weigh)
-
-        self.accept()
+        events_and_weighs = [
+            (
+                Event(event_date=event_date, animal_id=animal_id),
+                WeighEvent(weight_kg=weight, condition_score=condition),
+            )
+            for animal_id in self.animal_ids
+        ]
+        self._run_write(lambda db: db.save_weigh_events_bulk(events_and_weighs))
 
 
-class QuickStatusDialog(QDialog):
+class QuickStatusDialog(_QuickActionDialog):
     """Dialog for quickly changing animal status."""
 
     def __init__(self, db: Database, animal_ids: list[int], parent=None):
-        super().__init__(parent)
-        self.db = db
-        self.animal_ids = animal_ids
+        super().__init__(db, animal_ids, parent)
 
         self.setWindowTitle("Change Status")
         self.setMinimumWidth(400)
@@ -315,17 +447,20 @@ class QuickStatusDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Info label
-        info = QLabel(f"Changing status for {len(self.animal_ids)} animal(s)")
-        info.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
-        layout.addWidget(info)
+        self._add_info_label(layout, f"Changing status for {len(self.animal_ids)} animal(s)")
 
         form = QFormLayout()
 
         self.status_combo = QComboBox()
-        self.status_combo.addItem("Alive", AnimalStatus.ALIVE)
-        self.status_combo.addItem("Sold", AnimalStatus.SOLD)
-        self.status_combo.addItem("Dead", AnimalStatus.DEAD)
-        self.status_combo.addItem("Missing", AnimalStatus.MISSING)
+        _set_combo_items(
+            self.status_combo,
+            [
+                ("Alive", AnimalStatus.ALIVE),
+                ("Sold", AnimalStatus.SOLD),
+                ("Dead", AnimalStatus.DEAD),
+                ("Missing", AnimalStatus.MISSING),
+            ],
+        )
         form.addRow("New Status:", self.status_combo)
 
         self.date_edit = QDateEdit()
@@ -342,20 +477,8 @@ class QuickStatusDialog(QDialog):
         layout.addWidget(self.notes_edit)
 
         # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel
-        )
-        buttons.accepted.connect(self._on_accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        self._add_buttons(layout, QDialogButtonBox.StandardButton.Save, self._on_accept)
 
     def _on_accept(self) -> None:
         new_status = self.status_combo.currentData()
-
-        for animal_id in self.animal_ids:
-            animal = self.db.get_animal(animal_id)
-            if animal:
-                animal.status = new_status
-                self.db.save_animal(animal)
-
-        self.accept()
+        self._run_write(lambda db: db.bulk_set_status(self.animal_ids, new_status))
@@ -1,5 +1,7 @@
 """Main application window for Outback Stockbook."""
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -13,13 +15,14 @@ from PySide6.QtWidgets import (
     QFrame,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QKeySequence, QShortcut
 
 from stockbook import __app_name__, __version__
 from stockbook.models.database import Database
 from stockbook.ui.views.dashboard import DashboardView
 from stockbook.ui.views.animals import AnimalsView
+from stockbook.ui.views.base import BaseView
 from stockbook.ui.views.mobs import MobsView
 from stockbook.ui.views.paddocks import PaddocksView
 from stockbook.ui.views.treatments import TreatmentsView
@@ -28,6 +31,35 @@ from stockbook.ui.views.reports import ReportsView
 from stockbook.ui.views.settings import SettingsView
 
 
+# Pause in typing after which the search bar runs its search
+_SEARCH_DEBOUNCE_MS = 200
+
+# Sidebar entries as (label, tooltip); the label is also the view's title
+_NAV_ITEMS = (
+    ("Dashboard", "Home & overview"),
+    ("Animals", "Individual animals"),
+    ("Mobs", "Animal groups"),
+    ("Paddocks", "Property areas"),
+    ("Treatments", "Health & WHP"),
+    ("Weights", "Weight records"),
+    ("Reports", "Print & export"),
+    ("Settings", "Backup & config"),
+)
+
+# View classes in the same order as _NAV_ITEMS. Each is constructed the
+# first time it is navigated to rather than all at startup.
+_VIEW_CLASSES: tuple[type[BaseView], ...] = (
+    DashboardView,
+    AnimalsView,
+    MobsView,
+    PaddocksView,
+    TreatmentsView,
+    WeightsView,
+    ReportsView,
+    SettingsView,
+)
+
+
 class MainWindow(QMainWindow):
     """Main application window with sidebar navigation."""
 
@@ -56,9 +88,11 @@ class MainWindow(QMainWindow):
         # Set up keyboard shortcuts
         self._setup_shortcuts()
 
-        # Show dashboard by default
+        # Show dashboard by default. Creating it and loading its data is
+        # queued so the window can paint before the database is opened and
+        # queried.
         self.nav_buttons[0].setChecked(True)
-        self._on_nav_clicked(0)
+        QTimer.singleShot(0, lambda: self._on_nav_clicked(0))
 
     def _create_sidebar(self) -> QWidget:
         """Create the navigation sidebar."""
@@ -84,24 +118,14 @@ class MainWindow(QMainWindow):
         layout.addWidget(title_container)
 
         # Navigation buttons
-        nav_items = [
-            ("Dashboard", "Home & overview"),
-            ("Animals", "Individual animals"),
-            ("Mobs", "Animal groups"),
-            ("Paddocks", "Property areas"),
-            ("Treatments", "Health & WHP"),
-            ("Weights", "Weight records"),
-            ("Reports", "Print & export"),
-            ("Settings", "Backup & config"),
-        ]
-
         self.nav_buttons: list[QPushButton] = []
         self.nav_group = QButtonGroup(self)
         self.nav_group.setExclusive(True)
 
-        for i, (label, tooltip) in enumerate(nav_items):
+        for i, (label, tooltip) in enumerate(_NAV_ITEMS):
             btn = QPushButton(label)
             btn.setCheckable(True)
+            btn.setProperty("nav", True)
             btn.setToolTip(tooltip)
             self.nav_buttons.append(btn)
             self.nav_group.addButton(btn, i)
@@ -136,20 +160,8 @@ class MainWindow(QMainWindow):
         self.view_stack = QStackedWidget()
         self.view_stack.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-        # Create all views
-        self.views = [
-            DashboardView(self.db),
-            AnimalsView(self.db),
-            MobsView(self.db),
-            PaddocksView(self.db),
-            TreatmentsView(self.db),
-            WeightsView(self.db),
-            ReportsView(self.db),
-            SettingsView(self.db),
-        ]
-
-        for view in self.views:
-            self.view_stack.addWidget(view)
+        # Views are created on first use; see _get_view()
+        self.views: list[Optional[BaseView]] = [None] * len(_VIEW_CLASSES)
 
         layout.addWidget(self.view_stack)
 
@@ -170,6 +182,14 @@ class MainWindow(QMainWindow):
         self.search_bar.returnPressed.connect(self._on_search)
         layout.addWidget(self.search_bar)
 
+        # Search as the user types, once per burst of keystrokes: each edit
+        # restarts the timer, so only the last one in a burst searches
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._on_search)
+        self.search_bar.textChanged.connect(lambda _text: self._search_timer.start())
+
         layout.addStretch()
 
         # Current view title
@@ -186,7 +206,7 @@ class MainWindow(QMainWindow):
         search_shortcut.activated.connect(self._focus_search)
 
         # Navigation shortcuts (Alt+1 through Alt+8)
-        for i in range(8):
+        for i in range(len(_NAV_ITEMS)):
             shortcut = QShortcut(QKeySequence(f"Alt+{i + 1}"), self)
             shortcut.activated.connect(lambda idx=i: self._navigate_to(idx))
 
@@ -194,25 +214,25 @@ class MainWindow(QMainWindow):
         escape_shortcut = QShortcut(QKeySequence("Escape"), self)
         escape_shortcut.activated.connect(self._clear_search)
 
+    def _get_view(self, index: int) -> BaseView:
+        """Get the view at a sidebar index, creating it on first use."""
+        view = self.views[index]
+        if view is None:
+            view = _VIEW_CLASSES[index](self.db)
+            self.view_stack.addWidget(view)
+            self.views[index] = view
+        return view
+
     def _on_nav_clicked(self, index: int) -> None:
         """Handle navigation button click."""
-        self.view_stack.setCurrentIndex(index)
+        view = self._get_view(index)
+        self.view_stack.setCurrentWidget(view)
 
         # Update title
-        titles = [
-            "Dashboard",
-            "Animals",
-            "Mobs",
-            "Paddocks",
-            "Treatments",
-            "Weights",
-            "Reports",
-            "Settings",
-        ]
-        self.view_title.setText(titles[index])
-
-        # Refresh the view
-        self.views[index].refresh()
+        self.view_title.setText(_NAV_ITEMS[index][0])
+
+        # Refresh the view if anything has been written since it last was
+        view.refresh_if_stale()
 
     def _navigate_to(self, index: int) -> None:
         """Navigate to a specific view by index."""
@@ -232,11 +252,13 @@ class MainWindow(QMainWindow):
 
     def _on_search(self) -> None:
         """Handle search submission."""
+        # Return searches straight away; drop the pending typing search
+        self._search_timer.stop()
         query = self.search_bar.text().strip()
         if query:
             # Switch to animals view and search
             self._navigate_to(1)  # Animals view
-            animals_view = self.views[1]
+            animals_view = self._get_view(1)
             if hasattr(animals_view, "search"):
                 animals_view.search(query)
 
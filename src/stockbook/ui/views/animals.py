@@ -16,7 +16,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QFrame,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from stockbook.models.database import Database
 from stockbook.models.entities import Animal, AnimalStatus, AnimalSex, Species
@@ -24,6 +24,13 @@ from stockbook.ui.views.base import BaseView
 from stockbook.ui.dialogs.animal_dialog import AnimalDialog
 
 
+# Pause in typing after which the search field filters the table
+_SEARCH_DEBOUNCE_MS = 200
+
+# Most animals listed at once; narrow the filters to see the rest
+_MAX_ROWS = 500
+
+
 class AnimalsView(BaseView):
     """View for managing individual animals."""
 
@@ -69,9 +76,15 @@ class AnimalsView(BaseView):
         self.search_field = QLineEdit()
         self.search_field.setPlaceholderText("Tag or EID...")
         self.search_field.setMaximumWidth(200)
-        self.search_field.textChanged.connect(self._apply_filters)
         layout.addWidget(self.search_field)
 
+        # Filter once per burst of keystrokes rather than on every one
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_filters)
+        self.search_field.textChanged.connect(lambda _text: self._search_timer.start())
+
         layout.addSpacing(20)
 
         # Status filter
@@ -120,7 +133,7 @@ class AnimalsView(BaseView):
         layout.setContentsMargins(0, 10, 0, 10)
 
         add_btn = QPushButton("Add Animal")
-        add_btn.setObjectName("actionButton")
+        add_btn.setProperty("role", "action")
         add_btn.clicked.connect(self._on_add_animal)
         layout.addWidget(add_btn)
 
@@ -129,7 +142,7 @@ class AnimalsView(BaseView):
         layout.addWidget(edit_btn)
 
         delete_btn = QPushButton("Delete Selected")
-        delete_btn.setObjectName("dangerButton")
+        delete_btn.setProperty("role", "danger")
         delete_btn.clicked.connect(self._on_delete_animal)
         layout.addWidget(delete_btn)
 
@@ -150,18 +163,22 @@ class AnimalsView(BaseView):
         layout.addWidget(QLabel("Quick Actions:"))
 
         move_btn = QPushButton("Move to Mob")
+        move_btn.setProperty("quickAction", True)
         move_btn.clicked.connect(self._on_quick_move)
         layout.addWidget(move_btn)
 
         treat_btn = QPushButton("Record Treatment")
+        treat_btn.setProperty("quickAction", True)
         treat_btn.clicked.connect(self._on_quick_treat)
         layout.addWidget(treat_btn)
 
         weigh_btn = QPushButton("Record Weight")
+        weigh_btn.setProperty("quickAction", True)
         weigh_btn.clicked.connect(self._on_quick_weigh)
         layout.addWidget(weigh_btn)
 
         status_btn = QPushButton("Change Status")
+        status_btn.setProperty("quickAction", True)
         status_btn.clicked.connect(self._on_quick_status)
         layout.addWidget(status_btn)
 
@@ -194,39 +211,23 @@ class AnimalsView(BaseView):
 
     def _apply_filters(self) -> None:
         """Apply filters and refresh the table."""
+        # Any pending typing filter is covered by this one
+        self._search_timer.stop()
         status = self.status_filter.currentData()
         species = self.species_filter.currentData()
         mob_id = self.mob_filter.currentData()
-        search_text = self.search_field.text().strip().lower()
+        search_text = self.search_field.text().strip()
 
-        # Get animals
-        if status:
-            animals = self.db.get_all_animals(status=status)
+        # The database does the filtering and returns only the rows to show
+        animals = self.db.filter_animals(status, species, mob_id, search_text, limit=_MAX_ROWS)
+        if len(animals) < _MAX_ROWS:
+            total = len(animals)
         else:
-            animals = self.db.get_all_animals()
-
-        # Apply additional filters
-        filtered = []
-        for animal in animals:
-            # Species filter
-            if species and animal.species != species:
-                continue
-
-            # Mob filter
-            if mob_id and animal.mob_id != mob_id:
-                continue
-
-            # Search filter
-            if search_text:
-                searchable = (animal.visual_tag + animal.eid + animal.breed).lower()
-                if search_text not in searchable:
-                    continue
+            total = self.db.count_filtered_animals(status, species, mob_id, search_text)
 
-            filtered.append(animal)
+        self._populate_table(animals, total)
 
-        self._populate_table(filtered)
-
-    def _populate_table(self, animals: list[Animal]) -> None:
+    def _populate_table(self, animals: list[Animal], total: int) -> None:
         """Populate the table with animals."""
         self.table.setRowCount(0)
 
@@ -254,7 +255,10 @@ class AnimalsView(BaseView):
                 status_item.setForeground(Qt.GlobalColor.white)
             self.table.setItem(row, 7, status_item)
 
-        self.count_label.setText(f"{len(animals)} animals")
+        if total > len(animals):
+            self.count_label.setText(f"{len(animals)} of {total} animals")
+        else:
+            self.count_label.setText(f"{total} animals")
 
     def _get_selected_animal_ids(self) -> list[int]:
         """Get the IDs of selected animals."""
@@ -268,7 +272,7 @@ class AnimalsView(BaseView):
         """Handle adding a new animal."""
         dialog = AnimalDialog(self.db, parent=self)
         if dialog.exec():
-            self.refresh()
+            self.refresh_if_stale()
 
     def _on_edit_animal(self) -> None:
         """Handle editing the selected animal."""
@@ -281,7 +285,7 @@ class AnimalsView(BaseView):
         if animal:
             dialog = AnimalDialog(self.db, animal=animal, parent=self)
             if dialog.exec():
-                self.refresh()
+                self.refresh_if_stale()
 
     def _on_delete_animal(self) -> None:
         """Handle deleting selected animals."""
@@ -302,7 +306,7 @@ class AnimalsView(BaseView):
         if reply == QMessageBox.StandardButton.Yes:
             for animal_id in ids:
                 self.db.delete_animal(animal_id)
-            self.refresh()
+            self.refresh_if_stale()
 
     def _on_quick_move(self) -> None:
         """Handle quick move to mob."""
@@ -315,7 +319,7 @@ class AnimalsView(BaseView):
 
         dialog = QuickMoveDialog(self.db, ids, parent=self)
         if dialog.exec():
-            self.refresh()
+            self.refresh_if_stale()
 
     def _on_quick_treat(self) -> None:
         """Handle quick treatment recording."""
@@ -328,7 +332,7 @@ class AnimalsView(BaseView):
 
         dialog = QuickTreatmentDialog(self.db, ids, parent=self)
         if dialog.exec():
-            self.refresh()
+            self.refresh_if_stale()
 
     def _on_quick_weigh(self) -> None:
         """Handle quick weight recording."""
@@ -341,7 +345,7 @@ class AnimalsView(BaseView):
 
         dialog = QuickWeighDialog(self.db, ids, parent=self)
         if dialog.exec():
-            self.refresh()
+            self.refresh_if_stale()
 
     def _on_quick_status(self) -> None:
         """Handle quick status change."""
@@ -354,7 +358,7 @@ class AnimalsView(BaseView):
 
         dialog = QuickStatusDialog(self.db, ids, parent=self)
         if dialog.exec():
-            self.refresh()
+            self.refresh_if_stale()
 
     def search(self, query: str) -> None:
         """Search for animals matching the query."""
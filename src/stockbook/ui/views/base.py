@@ -1,5 +1,8 @@
 """Base view class for all views."""
 
+from datetime import date
+from typing import Optional
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton
 from PySide6.QtCore import Qt
 
@@ -9,10 +12,17 @@ from stockbook.models.database import Database
 class BaseView(QWidget):
     """Base class for all main views."""
 
+    # Style rules only this view needs. Applied the first time the view is
+    # shown so they stay out of the app-wide stylesheet parsed at startup.
+    view_stylesheet = ""
+
     def __init__(self, db: Database, title: str = ""):
         super().__init__()
         self.db = db
         self._title = title
+        self._view_style_applied = False
+        # Date and Database.data_version as of the last refresh_if_stale()
+        self._data_version: Optional[tuple[date, tuple[int, int]]] = None
 
         # Main layout
         self.main_layout = QVBoxLayout(self)
@@ -23,6 +33,25 @@ class BaseView(QWidget):
         """Refresh the view data. Override in subclasses."""
         pass
 
+    def refresh_if_stale(self) -> None:
+        """Refresh the view unless the database and date are unchanged since it last was.
+
+        The date is part of the check because withholding periods and due
+        tasks count days from today. Views call this rather than refresh()
+        after their own writes, so the next visit does not refresh again.
+        """
+        version = (date.today(), self.db.data_version)
+        if version != self._data_version:
+            self.refresh()
+            self._data_version = version
+
+    def showEvent(self, event) -> None:
+        """Apply the view's own stylesheet on first show."""
+        if self.view_stylesheet and not self._view_style_applied:
+            self.setStyleSheet(self.view_stylesheet)
+            self._view_style_applied = True
+        super().showEvent(event)
+
     def create_header(self, title: str, subtitle: str = "") -> QWidget:
         """Create a standard header widget."""
         header = QWidget()
@@ -54,11 +83,12 @@ class BaseView(QWidget):
 
         for label, callback, style in actions:
             btn = QPushButton(label)
+            btn.setProperty("quickAction", True)
 
             if style == "success":
-                btn.setObjectName("actionButton")
+                btn.setProperty("role", "action")
             elif style == "danger":
-                btn.setObjectName("dangerButton")
+                btn.setProperty("role", "danger")
 
             btn.clicked.connect(callback)
             layout.addWidget(btn)
@@ -1,7 +1,5 @@
 """Dashboard view for Outback Stockbook."""
 
-from datetime import date, timedelta
-
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -25,6 +23,15 @@ from stockbook.ui.views.base import BaseView
 class DashboardView(BaseView):
     """Main dashboard showing overview and alerts."""
 
+    view_stylesheet = """
+        QFrame#card {
+            background-color: #ffffff;
+            border: 1px solid #dee2e6;
+            border-radius: 8px;
+            padding: 15px;
+        }
+    """
+
     def __init__(self, db: Database):
         super().__init__(db, "Dashboard")
         self._setup_ui()
@@ -283,7 +290,6 @@ class DashboardView(BaseView):
         self.whp_table.show()
         self.whp_empty.hide()
 
-        today = date.today()
         for animal in whp_animals:
             row = self.whp_table.rowCount()
             self.whp_table.insertRow(row)
@@ -295,7 +301,7 @@ class DashboardView(BaseView):
             whp_end = animal["meat_whp_end"]
             if whp_end:
                 self.whp_table.setItem(row, 2, QTableWidgetItem(str(whp_end)))
-                days_left = (whp_end - today).days
+                days_left = animal["days_left"]
                 days_item = QTableWidgetItem(str(days_left))
                 if days_left <= 3:
                     days_item.setBackground(Qt.GlobalColor.red)
@@ -120,7 +120,7 @@ class MobsView(BaseView):
         action_layout.setContentsMargins(0, 0, 0, 10)
 
         add_btn = QPushButton("Add Mob")
-        add_btn.setObjectName("actionButton")
+        add_btn.setProperty("role", "action")
         add_btn.clicked.connect(self._on_add_mob)
         action_layout.addWidget(add_btn)
 
@@ -129,7 +129,7 @@ class MobsView(BaseView):
         action_layout.addWidget(edit_btn)
 
         delete_btn = QPushButton("Delete Selected")
-        delete_btn.setObjectName("dangerButton")
+        delete_btn.setProperty("role", "danger")
         delete_btn.clicked.connect(self._on_delete_mob)
         action_layout.addWidget(delete_btn)
 
@@ -158,6 +158,7 @@ class MobsView(BaseView):
         quick_layout.addWidget(QLabel("Quick Actions:"))
 
         move_btn = QPushButton("Move Mob to Paddock")
+        move_btn.setProperty("quickAction", True)
         move_btn.clicked.connect(self._on_move_mob)
         quick_layout.addWidget(move_btn)
 
@@ -195,7 +196,7 @@ class MobsView(BaseView):
     def _on_add_mob(self) -> None:
         dialog = MobDialog(self.db, parent=self)
         if dialog.exec():
-            self.refresh()
+            self.refresh_if_stale()
 
     def _on_edit_mob(self) -> None:
         mob_id = self._get_selected_mob_id()
@@ -207,7 +208,7 @@ class MobsView(BaseView):
         if mob:
             dialog = MobDialog(self.db, mob=mob, parent=self)
             if dialog.exec():
-                self.refresh()
+                self.refresh_if_stale()
 
     def _on_delete_mob(self) -> None:
         mob_id = self._get_selected_mob_id()
@@ -236,7 +237,7 @@ class MobsView(BaseView):
                 animal.mob_id = None
                 self.db.save_animal(animal)
             self.db.delete_mob(mob_id)
-            self.refresh()
+            self.refresh_if_stale()
 
     def _on_move_mob(self) -> None:
         mob_id = self._get_selected_mob_id()
@@ -279,4 +280,4 @@ class MobsView(BaseView):
         if dialog.exec():
             mob.current_paddock_id = paddock_combo.currentData()
             self.db.save_mob(mob)
-            self.refresh()
+            self.refresh_if_stale()
@@ -115,7 +115,7 @@ class PaddocksView(BaseView):
         action_layout.setContentsMargins(0, 0, 0, 10)
 
         add_btn = QPushButton("Add Paddock")
-        add_btn.setObjectName("actionButton")
+        add_btn.setProperty("role", "action")
         add_btn.clicked.connect(self._on_add_paddock)
         action_layout.addWidget(add_btn)
 
@@ -124,7 +124,7 @@ class PaddocksView(BaseView):
         action_layout.addWidget(edit_btn)
 
         delete_btn = QPushButton("Delete Selected")
-        delete_btn.setObjectName("dangerButton")
+        delete_btn.setProperty("role", "danger")
         delete_btn.clicked.connect(self._on_delete_paddock)
         action_layout.addWidget(delete_btn)
 
@@ -183,7 +183,7 @@ class PaddocksView(BaseView):
     def _on_add_paddock(self) -> None:
         dialog = PaddockDialog(self.db, parent=self)
         if dialog.exec():
-            self.refresh()
+            self.refresh_if_stale()
 
     def _on_edit_paddock(self) -> None:
         paddock_id = self._get_selected_paddock_id()
@@ -195,7 +195,7 @@ class PaddocksView(BaseView):
         if paddock:
             dialog = PaddockDialog(self.db, paddock=paddock, parent=self)
             if dialog.exec():
-                self.refresh()
+                self.refresh_if_stale()
 
     def _on_delete_paddock(self) -> None:
         paddock_id = self._get_selected_paddock_id()
@@ -220,4 +220,4 @@ class PaddocksView(BaseView):
                     mob.current_paddock_id = None
                     self.db.save_mob(mob)
             self.db.delete_paddock(paddock_id)
-            self.refresh()
+            self.refresh_if_stale()
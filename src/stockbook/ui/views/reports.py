@@ -2,6 +2,7 @@
 
 from datetime import date, timedelta
 from pathlib import Path
+from typing import Callable
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -19,7 +20,7 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QCheckBox,
 )
-from PySide6.QtCore import Qt, QDate
+from PySide6.QtCore import Qt, QDate, QObject, QRunnable, QThreadPool, Signal
 
 from stockbook.models.database import Database
 from stockbook.models.entities import AnimalStatus, EventType
@@ -27,12 +28,48 @@ from stockbook.ui.views.base import BaseView
 from stockbook.services.pdf_reports import ReportGenerator
 
 
+class _ReportSignals(QObject):
+    """Signals for _ReportWorker, which as a QRunnable cannot define its own."""
+
+    finished = Signal(str)  # Message to show
+    failed = Signal(str)  # Error text
+
+
+class _ReportWorker(QRunnable):
+    """Runs one report generation call on a pool thread."""
+
+    def __init__(self, generate: Callable, args: tuple, message: str):
+        super().__init__()
+        self.generate = generate
+        self.args = args
+        self.message = message
+        self.signals = _ReportSignals()
+
+    def run(self) -> None:
+        try:
+            self.generate(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.message)
+
+
 class ReportsView(BaseView):
     """View for generating and exporting reports."""
 
     def __init__(self, db: Database):
         super().__init__(db, "Reports")
-        self.report_generator = ReportGenerator(db)
+        # Reports are built off the UI thread, on a connection of their own so
+        # the UI's connection is never used from two threads at once. The pool
+        # runs one report at a time, which keeps that connection single-user;
+        # it is opened by the first report and closed with the view, once any
+        # report still running has finished.
+        report_db = Database(db.db_path)
+        self.report_generator = ReportGenerator(report_db)
+        report_pool = QThreadPool()
+        report_pool.setMaxThreadCount(1)
+        self._report_pool = report_pool
+        self.destroyed.connect(lambda: (report_pool.waitForDone(), report_db.close()))
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -172,7 +209,7 @@ class ReportsView(BaseView):
         layout.addStretch()
 
         generate_btn = QPushButton("Generate PDF")
-        generate_btn.setObjectName("actionButton")
+        generate_btn.setProperty("role", "action")
         generate_btn.clicked.connect(generate_func)
         layout.addWidget(generate_btn)
 
@@ -203,13 +240,11 @@ class ReportsView(BaseView):
         path = self._get_save_path(f"treatment_register_{from_date}_{to_date}.pdf")
 
         if path:
-            try:
-                self.report_generator.generate_treatment_register(path, from_date, to_date)
-                QMessageBox.information(
-                    self, "Report Generated", f"Treatment register saved to:\n{path}"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to generate report:\n{e}")
+            self._run_report(
+                self.report_generator.generate_treatment_register,
+                (path, from_date, to_date),
+                f"Treatment register saved to:\n{path}",
+            )
 
     def _generate_movement_report(self) -> None:
         """Generate movement log report."""
@@ -217,52 +252,44 @@ class ReportsView(BaseView):
         path = self._get_save_path(f"movement_log_{from_date}_{to_date}.pdf")
 
         if path:
-            try:
-                self.report_generator.generate_movement_log(path, from_date, to_date)
-                QMessageBox.information(
-                    self, "Report Generated", f"Movement log saved to:\n{path}"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to generate report:\n{e}")
+            self._run_report(
+                self.report_generator.generate_movement_log,
+                (path, from_date, to_date),
+                f"Movement log saved to:\n{path}",
+            )
 
     def _generate_whp_report(self) -> None:
         """Generate WHP clearance report."""
         path = self._get_save_path(f"whp_clearance_{date.today()}.pdf")
 
         if path:
-            try:
-                self.report_generator.generate_whp_clearance(path)
-                QMessageBox.information(
-                    self, "Report Generated", f"WHP clearance list saved to:\n{path}"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to generate report:\n{e}")
+            self._run_report(
+                self.report_generator.generate_whp_clearance,
+                (path,),
+                f"WHP clearance list saved to:\n{path}",
+            )
 
     def _generate_sale_draft(self) -> None:
         """Generate sale draft sheet."""
         path = self._get_save_path(f"sale_draft_{date.today()}.pdf")
 
         if path:
-            try:
-                self.report_generator.generate_sale_draft(path)
-                QMessageBox.information(
-                    self, "Report Generated", f"Sale draft sheet saved to:\n{path}"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to generate report:\n{e}")
+            self._run_report(
+                self.report_generator.generate_sale_draft,
+                (path,),
+                f"Sale draft sheet saved to:\n{path}",
+            )
 
     def _generate_inventory_report(self) -> None:
         """Generate animal inventory report."""
         path = self._get_save_path(f"animal_inventory_{date.today()}.pdf")
 
         if path:
-            try:
-                self.report_generator.generate_inventory(path)
-                QMessageBox.information(
-                    self, "Report Generated", f"Animal inventory saved to:\n{path}"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to generate report:\n{e}")
+            self._run_report(
+                self.report_generator.generate_inventory,
+                (path,),
+                f"Animal inventory saved to:\n{path}",
+            )
 
     def _generate_weight_report(self) -> None:
         """Generate weight summary report."""
@@ -270,14 +297,37 @@ class ReportsView(BaseView):
         path = self._get_save_path(f"weight_summary_{from_date}_{to_date}.pdf")
 
         if path:
-            try:
-                self.report_generator.generate_weight_summary(path, from_date, to_date)
-                QMessageBox.information(
-                    self, "Report Generated", f"Weight summary saved to:\n{path}"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to generate report:\n{e}")
+            self._run_report(
+                self.report_generator.generate_weight_summary,
+                (path, from_date, to_date),
+                f"Weight summary saved to:\n{path}",
+            )
+
+    def _run_report(self, generate: Callable, args: tuple, message: str) -> None:
+        """Run a ReportGenerator method on the report thread.
+
+        Shows message once the report has been written, or the error if it
+        failed. The signals are connected to this view's methods so the
+        message boxes open on the UI thread.
+        """
+        worker = _ReportWorker(generate, args, message)
+        worker.signals.finished.connect(self._on_report_finished)
+        worker.signals.failed.connect(self._on_report_failed)
+        self._report_pool.start(worker)
+
+    def _on_report_finished(self, message: str) -> None:
+        """Tell the user where the report was saved."""
+        QMessageBox.information(self, "Report Generated", message)
+
+    def _on_report_failed(self, error: str) -> None:
+        """Show why a report could not be generated."""
+        QMessageBox.critical(self, "Error", f"Failed to generate report:\n{error}")
 
     def refresh(self) -> None:
-        """Refresh view (no-op for reports)."""
-        pass
+        """Refresh view.
+
+        Records can only change while another view is shown, so dropping the
+        generator's cached lookups here keeps them current. The drop is queued
+        on the report thread so it never lands in the middle of a report.
+        """
+        self._report_pool.start(self.report_generator.invalidate)
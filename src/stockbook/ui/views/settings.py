@@ -89,7 +89,7 @@ class SettingsView(BaseView):
 
         # Save button
         save_btn = QPushButton("Save Property Settings")
-        save_btn.setObjectName("actionButton")
+        save_btn.setProperty("role", "action")
         save_btn.clicked.connect(self._save_property_settings)
         layout.addRow("", save_btn)
 
@@ -112,7 +112,7 @@ class SettingsView(BaseView):
         backup_row = QHBoxLayout()
 
         backup_btn = QPushButton("Create Backup")
-        backup_btn.setObjectName("actionButton")
+        backup_btn.setProperty("role", "action")
         backup_btn.clicked.connect(self._create_backup)
         backup_row.addWidget(backup_btn)
 
@@ -269,6 +269,6 @@ class SettingsView(BaseView):
                     "Database restored successfully.\n\n"
                     "The application data has been updated.",
                 )
-                self.refresh()
+                self.refresh_if_stale()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to restore backup:\n{e}")
@@ -1,7 +1,5 @@
 """Treatments view for Outback Stockbook."""
 
-from datetime import date, timedelta
-
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -161,6 +159,28 @@ class ProductDialog(QDialog):
 class TreatmentsView(BaseView):
     """View for managing treatments and withholding periods."""
 
+    view_stylesheet = """
+        QTabWidget::pane {
+            border: 2px solid #bdc3c7;
+            border-radius: 4px;
+        }
+
+        QTabBar::tab {
+            background-color: #ecf0f1;
+            padding: 12px 24px;
+            font-weight: bold;
+        }
+
+        QTabBar::tab:selected {
+            background-color: #3498db;
+            color: #ffffff;
+        }
+
+        QTabBar::tab:hover:!selected {
+            background-color: #bdc3c7;
+        }
+    """
+
     def __init__(self, db: Database):
         super().__init__(db, "Treatments")
         self._setup_ui()
@@ -257,7 +277,7 @@ class TreatmentsView(BaseView):
         action_layout.setContentsMargins(0, 0, 0, 10)
 
         add_btn = QPushButton("Add Product")
-        add_btn.setObjectName("actionButton")
+        add_btn.setProperty("role", "action")
         add_btn.clicked.connect(self._on_add_product)
         action_layout.addWidget(add_btn)
 
@@ -266,7 +286,7 @@ class TreatmentsView(BaseView):
         action_layout.addWidget(edit_btn)
 
         delete_btn = QPushButton("Delete Selected")
-        delete_btn.setObjectName("dangerButton")
+        delete_btn.setProperty("role", "danger")
         delete_btn.clicked.connect(self._on_delete_product)
         action_layout.addWidget(delete_btn)
 
@@ -309,8 +329,6 @@ class TreatmentsView(BaseView):
         self.whp_table.show()
         self.whp_empty.hide()
 
-        today = date.today()
-
         for item in whp_animals:
             row = self.whp_table.rowCount()
             self.whp_table.insertRow(row)
@@ -328,7 +346,7 @@ class TreatmentsView(BaseView):
 
             # Calculate days until clear (use meat WHP as primary)
             if meat_end:
-                days_left = (meat_end - today).days
+                days_left = item["days_left"]
                 days_item = QTableWidgetItem(str(days_left))
                 if days_left <= 3:
                     days_item.setBackground(Qt.GlobalColor.red)
@@ -412,7 +430,7 @@ class TreatmentsView(BaseView):
     def _on_add_product(self) -> None:
         dialog = ProductDialog(self.db, parent=self)
         if dialog.exec():
-            self.refresh()
+            self.refresh_if_stale()
 
     def _on_edit_product(self) -> None:
         product_id = self._get_selected_product_id()
@@ -424,7 +442,7 @@ class TreatmentsView(BaseView):
         if product:
             dialog = ProductDialog(self.db, product=product, parent=self)
             if dialog.exec():
-                self.refresh()
+                self.refresh_if_stale()
 
     def _on_delete_product(self) -> None:
         product_id = self._get_selected_product_id()
@@ -445,4 +463,4 @@ class TreatmentsView(BaseView):
 
         if reply == QMessageBox.StandardButton.Yes:
             self.db.delete_product(product_id)
-            self.refresh()
+            self.refresh_if_stale()
@@ -60,7 +60,8 @@ class WeightsView(BaseView):
         action_layout = QHBoxLayout(action_bar)
 
         record_btn = QPushButton("Record New Weights")
-        record_btn.setObjectName("actionButton")
+        record_btn.setProperty("role", "action")
+        record_btn.setProperty("quickAction", True)
         record_btn.clicked.connect(self._on_record_weights)
         action_layout.addWidget(record_btn)
 
@@ -331,4 +332,4 @@ class WeightsView(BaseView):
         # In a full implementation, you'd have a bulk weight entry screen
         dialog = QuickWeighDialog(self.db, [animals[0].id], parent=self)
         if dialog.exec():
-            self.refresh()
+            self.refresh_if_stale()